@@ -206,7 +206,7 @@ def run_full_system():
             except KeyboardInterrupt:
                 print("\n🛑 Demo stopped by user")
             finally:
-                robot.shutdown()
+                await robot.shutdown()
         
         asyncio.run(run_full_robot())
         
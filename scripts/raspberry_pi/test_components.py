@@ -33,8 +33,8 @@ def main():
     ppm = env_value = None
     async def _one():
         nonlocal ppm
-        raw = await gm._read_sensor('mq2')
-        ppm = gm._convert_to_ppm('mq2', raw)
+        readings = await gm._read_all_sensors()
+        ppm = readings['mq2'].ppm
     _asyncio.get_event_loop().run_until_complete(_one())
     print(f"Gas PPM (sim, mq2): {ppm:.1f}")
 
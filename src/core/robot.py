@@ -194,6 +194,8 @@ class SarusRobot:
                 
         except Exception as e:
             self.logger.error(f"Error in main loop: {e}")
+            if self.navigation_manager:
+                self.navigation_manager.stop_exploration_task()
             self.state = RobotState.ERROR
     
     async def _idle_loop(self):
@@ -278,13 +280,17 @@ class SarusRobot:
     async def _exploring_loop(self):
         """Handle exploration state - autonomous navigation"""
         if self.current_mission and self.navigation_manager:
-            mission_complete = await self.navigation_manager.continue_exploration(
-                self.current_mission
-            )
-            
-            if mission_complete:
+            # Exploration steps run in the navigation manager's own task
+            if self.navigation_manager.active_mission is not self.current_mission:
+                await self.navigation_manager.start_exploration_task(self.current_mission)
+            elif self.navigation_manager.exploration_mission_complete:
                 await self._complete_exploration_mission()
                 self.state = RobotState.IDLE
+            else:
+                # Surface a crashed exploration task to the main loop's error handling
+                error = self.navigation_manager.exploration_task_error()
+                if error is not None:
+                    raise error
     
     async def _error_loop(self):
         """Handle error state - attempt recovery"""
@@ -298,6 +304,8 @@ class SarusRobot:
             if self.display_controller:
                 await self.display_controller.show_error_animation()
             
+            if self.navigation_manager:
+                self.navigation_manager.stop_exploration_task()
             self.state = RobotState.IDLE
             self.logger.info("✅ Recovery successful")
             
@@ -404,13 +412,16 @@ class SarusRobot:
         
         return report
     
-    def shutdown(self):
+    async def shutdown(self):
         """Shutdown robot gracefully"""
         self.logger.info("🛑 Shutting down Sarus...")
         self.is_running = False
         self.state = RobotState.SHUTDOWN
         
         # Shutdown all subsystems
+        if self.navigation_manager:
+            await self.navigation_manager.close_exploration_task()
+        
         if self.motor_controller:
             self.motor_controller.stop_all_motors()
         
@@ -10,7 +10,7 @@ Integrates with Sarus navigation and emergency stop systems.
 import asyncio
 import logging
 import time
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, List
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
@@ -34,6 +34,14 @@ class MotorDirection(Enum):
     BACKWARD = "backward"
     STOP = "stop"
 
+# (left, right) motor directions for each batchable movement command
+BATCH_COMMAND_DIRECTIONS = {
+    'forward': (MotorDirection.FORWARD, MotorDirection.FORWARD),
+    'backward': (MotorDirection.BACKWARD, MotorDirection.BACKWARD),
+    'left': (MotorDirection.BACKWARD, MotorDirection.FORWARD),
+    'right': (MotorDirection.FORWARD, MotorDirection.BACKWARD),
+}
+
 @dataclass
 class MotorCommand:
     """Motor control command"""
@@ -295,6 +303,50 @@ class MotorController:
             await asyncio.sleep(duration)
             await self.stop()
     
+    async def execute_batch(self, commands: List[Tuple[str, Optional[float], Optional[float]]]):
+        """
+        Execute a sequence of movement commands back-to-back
+        
+        Each command transitions directly into the next and the motors are
+        stopped once at the end, instead of after every timed command.
+        
+        Args:
+            commands: List of (command, speed, duration) tuples where command is
+                      'forward', 'backward', 'left' or 'right'
+        """
+        if not commands:
+            return
+        
+        if self.emergency_stop_active:
+            self.logger.warning("Emergency stop active - movement blocked")
+            return
+        
+        for command, speed, duration in commands:
+            if self.emergency_stop_active:
+                break
+            
+            directions = BATCH_COMMAND_DIRECTIONS.get(command)
+            if directions is None:
+                self.logger.warning(f"Unknown batch command: {command}")
+                continue
+            
+            if speed is None:
+                speed = self.max_speed if command in ('forward', 'backward') else self.turn_speed
+            speed = max(0.0, min(1.0, speed))
+            
+            await self._set_individual_motor_direction(*directions)
+            await self._set_motor_speeds(speed, speed)
+            
+            if command in ('forward', 'backward'):
+                self.current_direction = directions[0]
+            self.is_moving = True
+            self.movement_start_time = time.time()
+            
+            if duration:
+                await asyncio.sleep(duration)
+        
+        await self.stop()
+    
     async def stop(self):
         """Stop all motor movement"""
         self.logger.info("🛑 Stopping motors")
@@ -12,13 +12,46 @@ import random
 import math
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, replace
+
+import numpy as np
+
+# Multi-pattern keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from ..hardware.motor_controller import MotorController
 from ..hardware.sensor_manager import SensorManager
 from ..ai.vision_manager import VisionManager
 from ..config.settings import SYSTEM_CONFIG
 from ..utils.logger import get_logger
+from ..utils.compat import DATACLASS_SLOTS
+
+# Occupancy grid covering the exploration area, centred on the start position
+GRID_RESOLUTION = 0.1  # meters per cell
+GRID_H = 200
+GRID_W = 200
+
+# Order of distances in per-tick obstacle arrays
+OBSTACLE_DIRECTIONS = ('front', 'left', 'right')
+
+# Object keywords recognised in scene descriptions
+COMMON_OBJECTS = (
+    'table', 'chair', 'computer', 'monitor', 'keyboard', 'mouse',
+    'book', 'paper', 'pen', 'calculator', 'lamp', 'phone',
+    'oscilloscope', 'multimeter', 'microscope', 'beaker', 'circuit'
+)
+
+if AHOCORASICK_AVAILABLE:
+    _OBJECT_AUTOMATON = ahocorasick.Automaton()
+    for _index, _obj in enumerate(COMMON_OBJECTS):
+        _OBJECT_AUTOMATON.add_word(_obj, (_index, _obj))
+    _OBJECT_AUTOMATON.make_automaton()
+else:
+    _OBJECT_AUTOMATON = None
 
 class NavigationState(Enum):
     """Navigation states"""
@@ -38,7 +71,7 @@ class MovementDirection(Enum):
     RIGHT = "right"
     STOP = "stop"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NavigationGoal:
     """Navigation goal definition"""
     target_object: Optional[str] = None
@@ -53,6 +86,14 @@ class NavigationManager:
     obstacle avoidance, and exploration behaviors
     """
     
+    # Exploration pattern name -> method name, resolved with getattr per step
+    _PATTERN_METHODS = {
+        'random': '_random_exploration',
+        'wall_follow': '_wall_follow_exploration',
+        'spiral': '_spiral_exploration',
+        'systematic': '_systematic_exploration'
+    }
+    
     def __init__(self, motor_controller: MotorController, 
                  sensor_manager: SensorManager, 
                  vision_manager: VisionManager):
@@ -70,22 +111,26 @@ class NavigationManager:
         self.emergency_threshold = SYSTEM_CONFIG.get('emergency_stop_distance', 10)
         
         # Navigation state
-        self.state = NavigationState.IDLE
+        self._set_state(NavigationState.IDLE)
         self.current_goal: Optional[NavigationGoal] = None
         
-        # Path tracking
-        self.position_history: List[Tuple[float, float, float]] = []  # x, y, timestamp
+        # Path tracking (ring buffer of x, y, monotonic timestamp rows)
+        self.position_history_size = 1000
+        self.position_history = np.zeros((self.position_history_size, 3), dtype=np.float64)
+        self._pos_head = 0  # Total positions written; next slot is head % size
         self.movement_history: List[str] = []
-        self.stuck_detection_threshold = 5  # Number of similar positions
+        self.stuck_detection_threshold = 20  # Number of recent positions compared
+        self.stuck_distance_threshold = 0.05  # meters
         
         # Exploration behavior
-        self.exploration_patterns = {
-            'random': self._random_exploration,
-            'wall_follow': self._wall_follow_exploration,
-            'spiral': self._spiral_exploration,
-            'systematic': self._systematic_exploration
-        }
         self.current_exploration_pattern = 'random'
+        self._rand = random.Random()
+        self._fwd_prob = 0.6  # Prefer forward movement
+        self._left_prob = 0.8  # Remaining mass split evenly between turns
+        
+        # Motor commands queued during one exploration step, sent as one batch
+        self._motor_batch: List[Tuple[str, float, float]] = []
+        self._last_obstacles = np.full(len(OBSTACLE_DIRECTIONS), 999.0)
         
         # Obstacle avoidance
         self.avoidance_behavior = 'simple'  # 'simple', 'advanced'
@@ -95,8 +140,32 @@ class NavigationManager:
         # Performance tracking
         self.total_distance_traveled = 0.0
         self.objects_found = []
-        self.areas_explored = set()
+        self.occupancy = np.zeros((GRID_H, GRID_W), dtype=np.uint8)  # bit 0 = visited
+        
+        # Long-running exploration task fed through a command queue
+        self._cmd_queue: Optional[asyncio.Queue] = None
+        self._exploration_task: Optional[asyncio.Task] = None
+        self.active_mission: Optional[Dict[str, Any]] = None
+        self.exploration_mission_complete = False
+        
+        # Status snapshot reused across get_navigation_status() polls
+        self._status: Dict[str, Any] = {
+            'state': self._state_value,
+            'current_goal': None,
+            'total_distance_traveled': 0.0,
+            'objects_found': 0,
+            'movement_history_length': 0,
+            'consecutive_obstacles': 0,
+            'exploration_pattern': self.current_exploration_pattern,
+            'position_history_length': 0
+        }
+        self._status_goal: Optional[NavigationGoal] = None
         
+    def _set_state(self, new_state: NavigationState):
+        """Update navigation state and its cached string value"""
+        self.state = new_state
+        self._state_value = new_state.value
+    
     async def execute_action(self, action: Dict[str, Any]) -> bool:
         """
         Execute a navigation action
@@ -166,7 +235,7 @@ class NavigationManager:
         )
         
         self.current_goal = goal
-        self.state = NavigationState.EXPLORING
+        self._set_state(NavigationState.EXPLORING)
         
         self.logger.info(f"🗺️ Starting exploration: {exploration_type} for {max_duration}s")
         return True
@@ -186,11 +255,77 @@ class NavigationManager:
         )
         
         self.current_goal = goal
-        self.state = NavigationState.SEEKING_TARGET
+        self._set_state(NavigationState.SEEKING_TARGET)
         
         self.logger.info(f"🎯 Seeking object: {target_object}")
         return True
     
+    async def start_exploration_task(self, mission_data: Dict[str, Any]):
+        """
+        Hand an exploration mission to the background exploration task
+        
+        The task keeps stepping the mission until it completes or
+        stop_exploration_task() is called; completion is reported through
+        exploration_mission_complete.
+        
+        Args:
+            mission_data: Current mission information
+        """
+        if self._cmd_queue is None:
+            self._cmd_queue = asyncio.Queue()
+        if self._exploration_task is None or self._exploration_task.done():
+            self._exploration_task = asyncio.ensure_future(self._exploration_task_loop())
+        
+        self.active_mission = mission_data
+        self.exploration_mission_complete = False
+        await self._cmd_queue.put(('explore', mission_data))
+    
+    def stop_exploration_task(self):
+        """Ask the background exploration task to stop the active mission"""
+        if self._cmd_queue is not None:
+            self._cmd_queue.put_nowait(('stop', None))
+    
+    def exploration_task_error(self) -> Optional[BaseException]:
+        """Exception that ended the exploration task, or None if it is alive or ended cleanly"""
+        task = self._exploration_task
+        if task is None or not task.done() or task.cancelled():
+            return None
+        return task.exception()
+    
+    async def close_exploration_task(self):
+        """Cancel the background exploration task and wait for it to finish"""
+        task, self._exploration_task = self._exploration_task, None
+        self.active_mission = None
+        if task is None:
+            return
+        
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Exploration task failed before shutdown: {e}")
+    
+    async def _exploration_task_loop(self):
+        """Step exploration missions received from the command queue"""
+        mission_data = None
+        
+        while True:
+            # Block for a command when idle; otherwise only pick up pending ones
+            if mission_data is None or not self._cmd_queue.empty():
+                command, payload = await self._cmd_queue.get()
+                if command == 'stop':
+                    if mission_data is not None:
+                        self.exploration_mission_complete = True
+                    mission_data = None
+                    continue
+                mission_data = payload
+            
+            if await self.continue_exploration(mission_data):
+                self.exploration_mission_complete = True
+                mission_data = None
+    
     async def continue_exploration(self, mission_data: Dict[str, Any]) -> bool:
         """
         Continue exploration mission
@@ -205,11 +340,12 @@ class NavigationManager:
             return True  # Mission complete if not exploring
         
         try:
-            # Check mission duration
-            start_time = mission_data.get('start_time', time.time())
+            # Check mission duration (mission start_time is wall-clock, set by the robot core)
+            now = time.time()
+            start_time = mission_data.get('start_time', now)
             max_duration = mission_data.get('max_duration', 300.0)
             
-            if time.time() - start_time > max_duration:
+            if now - start_time > max_duration:
                 self.logger.info("⏰ Exploration mission time limit reached")
                 return True
             
@@ -232,45 +368,67 @@ class NavigationManager:
     
     async def _perform_exploration_step(self):
         """Perform one step of exploration behavior"""
-        # Get current sensor readings
-        nav_data = self.sensor_manager.get_navigation_data()
-        obstacles = nav_data.get('obstacles', {})
+        # Read obstacle distances once per tick (front, left, right)
+        obstacles = self.sensor_manager.get_obstacle_map()
+        self._last_obstacles = np.fromiter(
+            (obstacles.get(direction, 999.0) for direction in OBSTACLE_DIRECTIONS),
+            dtype=np.float64, count=len(OBSTACLE_DIRECTIONS)
+        )
         
-        # Check for immediate obstacles requiring avoidance
-        if await self._need_obstacle_avoidance(obstacles):
-            await self._perform_obstacle_avoidance(obstacles)
+        command, speed, duration, emergency = self._decide_step(self._last_obstacles)
+        
+        # Handle immediate obstacles before continuing the pattern
+        if command != 'pattern':
+            await self._perform_obstacle_avoidance(self._last_obstacles, command, speed, duration, emergency)
             return
         
         # Continue with exploration pattern
-        exploration_func = self.exploration_patterns.get(
-            self.current_exploration_pattern, 
-            self._random_exploration
-        )
+        await getattr(self, self._PATTERN_METHODS[self.current_exploration_pattern])()
+    
+    def _decide_step(self, obstacles_arr: np.ndarray) -> Tuple[str, float, float, bool]:
+        """
+        Decide the motor command for this tick from one obstacle reading
+        
+        Args:
+            obstacles_arr: Distances in cm ordered as OBSTACLE_DIRECTIONS
+        
+        Returns:
+            (command, speed, duration, emergency) where command is 'pattern'
+            when no avoidance is needed, otherwise a turn direction; emergency
+            is True when the robot must stop before turning
+        """
+        min_dist = obstacles_arr.min()
+        if min_dist >= self.obstacle_threshold:
+            return 'pattern', 0.0, 0.0, False
         
-        await exploration_func()
+        # Emergency stop first if very close
+        emergency = bool(min_dist < self.emergency_threshold)
+        
+        front_dist, left_dist, right_dist = obstacles_arr
+        if front_dist < self.obstacle_threshold:
+            # Obstacle ahead - turn toward clearer side
+            return ('left' if left_dist > right_dist else 'right'), self.turn_speed, 1.0, emergency
+        
+        # Obstacle on one side - turn away from it
+        return ('right' if left_dist < self.obstacle_threshold else 'left'), self.turn_speed, 0.8, emergency
     
     async def _random_exploration(self):
         """Random exploration pattern"""
-        # Choose random direction and duration
-        directions = ['forward', 'left', 'right']
-        weights = [0.6, 0.2, 0.2]  # Prefer forward movement
-        
-        direction = random.choices(directions, weights=weights)[0]
+        # Choose random direction and duration (threshold compare, no per-tick allocation)
+        r = self._rand.random()
+        direction = 'forward' if r < self._fwd_prob else ('left' if r < self._left_prob else 'right')
         
         if direction == 'forward':
-            duration = random.uniform(1.0, 3.0)
+            duration = self._rand.uniform(1.0, 3.0)
             if await self._is_path_safe('front'):
-                await self.motor_controller.move_forward(self.max_speed * 0.7, duration)
+                self._enqueue('forward', self.max_speed * 0.7, duration)
             else:
                 # Turn instead
-                turn_direction = random.choice(['left', 'right'])
-                await self.motor_controller.turn_left(self.turn_speed, 1.0) if turn_direction == 'left' else await self.motor_controller.turn_right(self.turn_speed, 1.0)
+                self._enqueue('left' if self._rand.random() < 0.5 else 'right', self.turn_speed, 1.0)
         else:
-            duration = random.uniform(0.5, 1.5)
-            if direction == 'left':
-                await self.motor_controller.turn_left(self.turn_speed, duration)
-            else:
-                await self.motor_controller.turn_right(self.turn_speed, duration)
+            duration = self._rand.uniform(0.5, 1.5)
+            self._enqueue(direction, self.turn_speed, duration)
+        await self._flush_motor_batch()
         
         # Record movement
         self.movement_history.append(f"{direction}_{duration:.1f}")
@@ -278,32 +436,29 @@ class NavigationManager:
     
     async def _wall_follow_exploration(self):
         """Wall following exploration pattern"""
-        nav_data = self.sensor_manager.get_navigation_data()
-        obstacles = nav_data.get('obstacles', {})
-        
-        front_dist = obstacles.get('front', 999)
-        left_dist = obstacles.get('left', 999)
-        right_dist = obstacles.get('right', 999)
+        # Reuse the distances read at the start of this exploration step
+        front_dist, left_dist, right_dist = self._last_obstacles
         
         # Simple wall following logic
         if front_dist < self.obstacle_threshold:
             # Wall ahead, turn away from closer side
             if left_dist < right_dist:
-                await self.motor_controller.turn_right(self.turn_speed, 0.8)
+                self._enqueue('right', self.turn_speed, 0.8)
             else:
-                await self.motor_controller.turn_left(self.turn_speed, 0.8)
+                self._enqueue('left', self.turn_speed, 0.8)
         elif right_dist < 40:  # Follow right wall
             # Stay close to right wall
             if right_dist < 20:
                 # Too close, turn left slightly
-                await self.motor_controller.turn_left(self.turn_speed * 0.5, 0.3)
+                self._enqueue('left', self.turn_speed * 0.5, 0.3)
             else:
                 # Good distance, move forward
-                await self.motor_controller.move_forward(self.max_speed * 0.6, 1.0)
+                self._enqueue('forward', self.max_speed * 0.6, 1.0)
         else:
             # No wall on right, turn right to find wall
-            await self.motor_controller.turn_right(self.turn_speed, 0.5)
+            self._enqueue('right', self.turn_speed, 0.5)
         
+        await self._flush_motor_batch()
         await asyncio.sleep(0.3)
     
     async def _spiral_exploration(self):
@@ -312,8 +467,9 @@ class NavigationManager:
         forward_time = 2.0
         turn_time = 0.3
         
-        await self.motor_controller.move_forward(self.max_speed * 0.6, forward_time)
-        await self.motor_controller.turn_right(self.turn_speed, turn_time)
+        self._enqueue('forward', self.max_speed * 0.6, forward_time)
+        self._enqueue('right', self.turn_speed, turn_time)
+        await self._flush_motor_batch()
         
         await asyncio.sleep(0.2)
     
@@ -323,62 +479,54 @@ class NavigationManager:
         if len(self.movement_history) % 8 < 4:
             # Move forward phase
             if await self._is_path_safe('front'):
-                await self.motor_controller.move_forward(self.max_speed * 0.7, 2.0)
+                self._enqueue('forward', self.max_speed * 0.7, 2.0)
             else:
-                await self.motor_controller.turn_right(self.turn_speed, 1.6)  # 90 degree turn
+                self._enqueue('right', self.turn_speed, 1.6)  # 90 degree turn
         else:
             # Turn and move to next row
-            await self.motor_controller.turn_right(self.turn_speed, 0.8)
+            self._enqueue('right', self.turn_speed, 0.8)
         
+        await self._flush_motor_batch()
         await asyncio.sleep(0.3)
     
-    async def _need_obstacle_avoidance(self, obstacles: Dict[str, float]) -> bool:
-        """Check if obstacle avoidance is needed"""
-        for direction, distance in obstacles.items():
-            if distance < self.obstacle_threshold:
-                return True
-        return False
+    def _enqueue(self, command: str, speed: float, duration: float):
+        """Queue a motor command for the current exploration step"""
+        self._motor_batch.append((command, speed, duration))
     
-    async def _perform_obstacle_avoidance(self, obstacles: Dict[str, float]):
-        """Perform obstacle avoidance maneuver"""
-        self.state = NavigationState.AVOIDING_OBSTACLE
+    async def _flush_motor_batch(self):
+        """Send all queued motor commands in a single batch"""
+        if not self._motor_batch:
+            return
+        try:
+            await self.motor_controller.execute_batch(self._motor_batch)
+        finally:
+            self._motor_batch.clear()
+    
+    async def _perform_obstacle_avoidance(self, obstacles_arr: np.ndarray,
+                                          command: str, speed: float, duration: float,
+                                          emergency: bool = False):
+        """Perform the obstacle avoidance maneuver chosen by _decide_step"""
+        self._set_state(NavigationState.AVOIDING_OBSTACLE)
         self.consecutive_obstacles += 1
         
-        front_dist = obstacles.get('front', 999)
-        left_dist = obstacles.get('left', 999)
-        right_dist = obstacles.get('right', 999)
-        
-        self.logger.info(f"🚧 Avoiding obstacle: F={front_dist:.1f}, L={left_dist:.1f}, R={right_dist:.1f}")
+        if self.logger.isEnabledFor(logging.INFO):
+            front_dist, left_dist, right_dist = obstacles_arr
+            self.logger.info("🚧 Avoiding obstacle: F=%.1f, L=%.1f, R=%.1f", front_dist, left_dist, right_dist)
         
-        # Emergency stop if very close
-        if any(dist < self.emergency_threshold for dist in obstacles.values()):
+        if emergency:
             self.logger.warning("🚨 Emergency stop - obstacle too close!")
             await self.motor_controller.emergency_stop()
             await asyncio.sleep(1.0)
         
-        # Choose avoidance strategy
-        if front_dist < self.obstacle_threshold:
-            # Obstacle ahead - turn toward clearer side
-            if left_dist > right_dist:
-                self.logger.debug("Turning left to avoid obstacle")
-                await self.motor_controller.turn_left(self.turn_speed, 1.0)
-            else:
-                self.logger.debug("Turning right to avoid obstacle")
-                await self.motor_controller.turn_right(self.turn_speed, 1.0)
-        
-        elif left_dist < self.obstacle_threshold:
-            # Obstacle on left - turn right
-            await self.motor_controller.turn_right(self.turn_speed, 0.8)
-        
-        elif right_dist < self.obstacle_threshold:
-            # Obstacle on right - turn left
-            await self.motor_controller.turn_left(self.turn_speed, 0.8)
+        self.logger.debug("Turning %s to avoid obstacle", command)
+        self._enqueue(command, speed, duration)
+        await self._flush_motor_batch()
         
         # Brief pause after avoidance
         await asyncio.sleep(0.5)
         
-        self.state = NavigationState.EXPLORING
-        self.last_obstacle_time = time.time()
+        self._set_state(NavigationState.EXPLORING)
+        self.last_obstacle_time = time.monotonic()
     
     async def _is_path_safe(self, direction: str) -> bool:
         """Check if path is safe in given direction"""
@@ -388,14 +536,17 @@ class NavigationManager:
         """Detect if robot is stuck in a loop or can't make progress"""
         # Check if too many consecutive obstacles
         if self.consecutive_obstacles > 10:
-            recent_time = time.time() - self.last_obstacle_time
+            recent_time = time.monotonic() - self.last_obstacle_time
             if recent_time < 30:  # Many obstacles in short time
                 return True
         
-        # Check movement history for repetitive patterns
-        if len(self.movement_history) > 10:
-            recent_moves = self.movement_history[-6:]
-            if len(set(recent_moves)) <= 2:  # Only 2 or fewer unique moves
+        # Check whether recent positions stay clustered around their centroid
+        k = self.stuck_detection_threshold
+        if self._pos_head >= k:
+            rows = np.arange(self._pos_head - k, self._pos_head)
+            recent = np.take(self.position_history[:, :2], rows, axis=0, mode='wrap')
+            max_dev = np.linalg.norm(recent - recent.mean(axis=0), axis=1).max()
+            if max_dev < self.stuck_distance_threshold:
                 return True
         
         return False
@@ -433,26 +584,19 @@ class NavigationManager:
         """Extract potential object names from scene description"""
         # Simple keyword-based object extraction
         # In reality, would use NLP or structured object detection
-        
-        common_objects = [
-            'table', 'chair', 'computer', 'monitor', 'keyboard', 'mouse',
-            'book', 'paper', 'pen', 'calculator', 'lamp', 'phone',
-            'oscilloscope', 'multimeter', 'microscope', 'beaker', 'circuit'
-        ]
-        
-        found_objects = []
         description_lower = description.lower()
         
-        for obj in common_objects:
-            if obj in description_lower:
-                found_objects.append(obj)
+        if _OBJECT_AUTOMATON is not None:
+            # Single linear scan over the description for all keywords
+            matches = {value for _, value in _OBJECT_AUTOMATON.iter(description_lower)}
+            return [obj for _, obj in sorted(matches)]
         
-        return found_objects
+        return [obj for obj in COMMON_OBJECTS if obj in description_lower]
     
     async def _update_position_estimate(self, direction: str, duration: float):
         """Update estimated position based on movement"""
         # Simple dead reckoning - in reality would use odometry/SLAM
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Estimate distance moved (very rough)
         if direction == 'forward':
@@ -463,14 +607,31 @@ class NavigationManager:
             self.total_distance_traveled += abs(estimated_distance)
         
         # Add to position history (placeholder coordinates)
-        estimated_x = len(self.position_history) * 0.1
+        estimated_x = self._pos_head * 0.1
         estimated_y = random.uniform(-0.5, 0.5)
         
-        self.position_history.append((estimated_x, estimated_y, current_time))
+        self.position_history[self._pos_head % self.position_history_size] = (
+            estimated_x, estimated_y, current_time
+        )
+        self._pos_head += 1
         
-        # Limit history size
-        if len(self.position_history) > 1000:
-            self.position_history = self.position_history[-500:]
+        # Mark the cell as explored
+        cell = self._grid_cell(estimated_x, estimated_y)
+        if cell is not None:
+            self.occupancy[cell] |= 1
+    
+    def _grid_cell(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """Convert a position in meters to an occupancy grid (row, col), or None if off-grid"""
+        ix = math.floor(x / GRID_RESOLUTION) + GRID_W // 2
+        iy = math.floor(y / GRID_RESOLUTION) + GRID_H // 2
+        if 0 <= ix < GRID_W and 0 <= iy < GRID_H:
+            return iy, ix
+        return None
+    
+    def is_area_explored(self, x: float, y: float) -> bool:
+        """Check whether the grid cell containing (x, y) has been visited"""
+        cell = self._grid_cell(x, y)
+        return cell is not None and bool(self.occupancy[cell] & 1)
     
     async def navigate_to_object(self, object_name: str, timeout: float = 60.0) -> bool:
         """
@@ -483,27 +644,18 @@ class NavigationManager:
         Returns:
             True if object was reached, False if not found/timeout
         """
-        start_time = time.time()
-        self.state = NavigationState.SEEKING_TARGET
+        deadline = time.monotonic() + timeout
+        self._set_state(NavigationState.SEEKING_TARGET)
         
         self.logger.info(f"🎯 Navigating to object: {object_name}")
         
-        while time.time() - start_time < timeout:
+        # Check the deadline between steps so a motor command is never cut off
+        # before it has stopped the motors
+        while time.monotonic() < deadline:
             try:
-                # Look for the object
-                detected_object = await self.vision_manager.find_object(object_name)
-                
-                if detected_object:
-                    # Object found - move toward it
-                    success = await self._approach_object(detected_object)
-                    if success:
-                        self.logger.info(f"✅ Successfully reached {object_name}")
-                        return True
-                else:
-                    # Object not visible - explore to find it
-                    await self._search_for_object()
-                
-                await asyncio.sleep(0.5)
+                if await self._seek_step(object_name):
+                    self.logger.info(f"✅ Successfully reached {object_name}")
+                    return True
                 
             except Exception as e:
                 self.logger.error(f"Error during object navigation: {e}")
@@ -512,6 +664,27 @@ class NavigationManager:
         self.logger.warning(f"❌ Failed to find/reach {object_name} within {timeout}s")
         return False
     
+    async def _seek_step(self, object_name: str) -> bool:
+        """
+        Perform one look-and-move step toward an object
+        
+        Returns:
+            True if the object was reached, False to keep seeking
+        """
+        # Look for the object
+        detected_object = await self.vision_manager.find_object(object_name)
+        
+        if detected_object:
+            # Object found - move toward it
+            if await self._approach_object(detected_object):
+                return True
+        else:
+            # Object not visible - explore to find it
+            await self._search_for_object()
+        
+        await asyncio.sleep(0.5)
+        return False
+    
     async def _approach_object(self, detected_object: Dict[str, Any]) -> bool:
         """Approach a detected object"""
         # Simple approach behavior
@@ -534,20 +707,33 @@ class NavigationManager:
     
     def get_navigation_status(self) -> Dict[str, Any]:
         """Get current navigation status"""
-        return {
-            'state': self.state.value,
-            'current_goal': self.current_goal.__dict__ if self.current_goal else None,
-            'total_distance_traveled': self.total_distance_traveled,
-            'objects_found': len(self.objects_found),
-            'movement_history_length': len(self.movement_history),
-            'consecutive_obstacles': self.consecutive_obstacles,
-            'exploration_pattern': self.current_exploration_pattern,
-            'position_history_length': len(self.position_history)
-        }
+        status = self._status
+        
+        # Goal dict only needs rebuilding when the goal changes; compare against a
+        # private copy so edits made to the goal in place are picked up too
+        goal = self.current_goal
+        if goal != self._status_goal:
+            self._status_goal = replace(goal) if goal else None
+            status['current_goal'] = asdict(goal) if goal else None
+        
+        status['state'] = self._state_value
+        status['total_distance_traveled'] = self.total_distance_traveled
+        status['objects_found'] = len(self.objects_found)
+        status['movement_history_length'] = len(self.movement_history)
+        status['consecutive_obstacles'] = self.consecutive_obstacles
+        status['exploration_pattern'] = self.current_exploration_pattern
+        status['position_history_length'] = min(self._pos_head, self.position_history_size)
+        
+        # Callers get their own copy, including the goal dict, so the cached
+        # snapshot is never mutated externally
+        result = status.copy()
+        if result['current_goal'] is not None:
+            result['current_goal'] = dict(result['current_goal'])
+        return result
     
     def set_exploration_pattern(self, pattern: str):
         """Set exploration behavior pattern"""
-        if pattern in self.exploration_patterns:
+        if pattern in self._PATTERN_METHODS:
             self.current_exploration_pattern = pattern
             self.logger.info(f"🔄 Exploration pattern changed to: {pattern}")
         else:
@@ -555,10 +741,12 @@ class NavigationManager:
     
     def reset_navigation_state(self):
         """Reset navigation state and history"""
-        self.state = NavigationState.IDLE
+        self._set_state(NavigationState.IDLE)
         self.current_goal = None
         self.movement_history.clear()
-        self.position_history.clear()
+        self.position_history.fill(0.0)
+        self._pos_head = 0
+        self.occupancy.fill(0)
         self.objects_found.clear()
         self.total_distance_traveled = 0.0
         self.consecutive_obstacles = 0
@@ -567,8 +755,9 @@ class NavigationManager:
     
     async def emergency_stop_navigation(self):
         """Emergency stop all navigation"""
-        self.state = NavigationState.IDLE
+        self._set_state(NavigationState.IDLE)
         self.current_goal = None
+        self.stop_exploration_task()
         await self.motor_controller.emergency_stop()
         
         self.logger.warning("🚨 Navigation emergency stop activated")
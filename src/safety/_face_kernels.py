@@ -0,0 +1,35 @@
+"""
+Face matching kernels
+
+Squared Euclidean distance from one face encoding to every enrolled
+encoding. Uses a Numba-compiled loop when available (vectorised to
+NEON/AVX by LLVM, no BLAS needed), otherwise a NumPy matrix-vector product.
+"""
+
+import numpy as np
+
+# Optional JIT for targets without an optimised BLAS (e.g. Raspberry Pi)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit('f4[::1](f4[:, ::1], f4[::1], f4[::1])', fastmath=True, cache=True)
+    def squared_distances(known, known_sq_norms, query):
+        """Squared L2 distance from query to each row of known"""
+        n, dim = known.shape
+        out = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            s = np.float32(0.0)
+            for j in range(dim):
+                d = known[i, j] - query[j]
+                s += d * d
+            out[i] = s
+        return out
+else:
+    def squared_distances(known, known_sq_norms, query):
+        """Squared L2 distance from query to each row of known"""
+        # |k - q|^2 = |k|^2 - 2 k.q + |q|^2: one matrix-vector product
+        return known_sq_norms - 2.0 * (known @ query) + query @ query
@@ -9,13 +9,26 @@ critical safety situations.
 import asyncio
 import logging
 import time
+from collections import deque
+from itertools import islice
 from typing import Callable, Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from ..utils.logging import get_security_logger
+from ..utils.compat import DATACLASS_SLOTS
+
 class EmergencyType(Enum):
     """Types of emergency situations"""
+    
+    def __new__(cls, value):
+        # Keep the string value and give each member a 0-based declaration index
+        member = object.__new__(cls)
+        member._value_ = value
+        member.index = len(cls.__members__)
+        return member
+    
     GAS_LEAK = "gas_leak"
     FIRE = "fire"
     INTRUDER = "intruder"
@@ -24,15 +37,34 @@ class EmergencyType(Enum):
     SYSTEM_CRITICAL = "system_critical"
     MANUAL_STOP = "manual_stop"
 
-@dataclass
+# Emergency level for each severity name
+_SEVERITY_LEVEL = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EmergencyEvent:
     """Emergency event data"""
     event_type: EmergencyType
     severity: str  # 'low', 'medium', 'high', 'critical'
     message: str
-    timestamp: datetime
+    timestamp: datetime  # Wall clock, for display and logs
     source: str
     data: Dict[str, Any]
+    timestamp_mono: float = field(default_factory=time.monotonic)  # For duration math
+
+class _NullStoppable:
+    """No-op stand-in for a motor controller or navigation manager"""
+    
+    async def emergency_stop(self):
+        pass
+
+class _NullController:
+    """No-op stand-ins for whatever the robot controller does not provide"""
+    
+    motor_controller = _NullStoppable()
+    navigation_manager = _NullStoppable()
+    
+    async def speak(self, text: str):
+        pass
 
 class EmergencyStop:
     """
@@ -45,36 +77,84 @@ class EmergencyStop:
     - Critical event logging
     """
     
+    # Spoken announcement for each emergency type
+    _ANNOUNCEMENTS: Dict[EmergencyType, str] = {
+        EmergencyType.GAS_LEAK: (
+            "EMERGENCY: Gas leak detected! Evacuating area immediately! "
+            "All personnel must leave the lab now!"
+        ),
+        EmergencyType.FIRE: (
+            "FIRE EMERGENCY! Evacuate immediately! "
+            "Exit the building using the nearest safe exit!"
+        ),
+        EmergencyType.INTRUDER: (
+            "Security alert: Unauthorized personnel detected. "
+            "Security has been notified."
+        ),
+        EmergencyType.HARDWARE_FAILURE: (
+            "Critical hardware failure detected. "
+            "Entering safe mode. Please check system status."
+        ),
+        EmergencyType.USER_EMERGENCY: (
+            "User emergency activated. Help is being contacted. "
+            "Please stay calm and follow safety procedures."
+        ),
+        EmergencyType.SYSTEM_CRITICAL: (
+            "Critical system error. Initiating emergency shutdown. "
+            "Data is being protected."
+        ),
+        EmergencyType.MANUAL_STOP: "Manual emergency stop activated. All operations paused.",
+    }
+    
     def __init__(self, config, robot_controller=None):
         self.logger = logging.getLogger(__name__)
+        self.security_logger = get_security_logger()  # Queued; never writes on the event loop
         self.config = config
         self.robot_controller = robot_controller
         
+        # Stand-ins for whatever the controller lacks when an emergency fires
+        self._null = _NullController()
+        
         # Emergency state
         self.emergency_active = False
         self.emergency_level = 0  # 0=normal, 1=warning, 2=alert, 3=critical
         self.current_emergency: Optional[EmergencyEvent] = None
         
-        # Emergency procedures
-        self.emergency_procedures = {
-            EmergencyType.GAS_LEAK: self._handle_gas_leak,
-            EmergencyType.FIRE: self._handle_fire_emergency,
-            EmergencyType.INTRUDER: self._handle_security_breach,
-            EmergencyType.HARDWARE_FAILURE: self._handle_hardware_failure,
-            EmergencyType.USER_EMERGENCY: self._handle_user_emergency,
-            EmergencyType.SYSTEM_CRITICAL: self._handle_system_critical,
-            EmergencyType.MANUAL_STOP: self._handle_manual_stop
-        }
+        # Emergency procedures, indexed by EmergencyType.index (declaration order)
+        self._procs = (
+            self._handle_gas_leak,
+            self._handle_fire_emergency,
+            self._handle_security_breach,
+            self._handle_hardware_failure,
+            self._handle_user_emergency,
+            self._handle_system_critical,
+            self._handle_manual_stop
+        )
         
         # Callback functions
         self.alert_callbacks: List[Callable] = []
         self.shutdown_callbacks: List[Callable] = []
         
         # Emergency history
-        self.emergency_history: List[EmergencyEvent] = []
+        self.emergency_history: deque = deque(maxlen=10000)  # Oldest events drop off
+        self._recent_event_times: deque = deque()  # Monotonic trigger times within the last 24h
+        
+        # Event loop that trigger_emergency_from_irq() schedules onto
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
         
         self.logger.info("Emergency Stop system initialized")
     
+    def _collaborator(self, name: str):
+        """Look up a robot collaborator now, falling back to a no-op if it is missing or None"""
+        return getattr(self.robot_controller, name, None) or getattr(self._null, name)
+    
+    async def _speak(self, text: str):
+        """Announce text through the robot controller, if it can speak"""
+        await self._collaborator('speak')(text)
+    
     def register_alert_callback(self, callback: Callable):
         """Register callback for emergency alerts"""
         self.alert_callbacks.append(callback)
@@ -83,6 +163,21 @@ class EmergencyStop:
         """Register callback for emergency shutdown"""
         self.shutdown_callbacks.append(callback)
     
+    def bind_event_loop(self, loop: asyncio.AbstractEventLoop):
+        """Set the event loop that interrupt-triggered emergencies run on"""
+        self._loop = loop
+    
+    def trigger_emergency_from_irq(self, emergency_type: EmergencyType, message: str):
+        """Trigger an emergency from a GPIO interrupt (or any non-loop) thread"""
+        if self._loop is None:
+            raise RuntimeError("No event loop bound; call bind_event_loop() first")
+        
+        # Fire-and-forget: cheaper than run_coroutine_threadsafe, which builds a concurrent Future
+        self._loop.call_soon_threadsafe(
+            self._loop.create_task,
+            self.trigger_emergency(emergency_type, message, severity='critical', source='irq')
+        )
+    
     async def trigger_emergency(self, 
                               emergency_type: EmergencyType, 
                               message: str, 
@@ -101,22 +196,27 @@ class EmergencyStop:
             message=message,
             timestamp=datetime.now(),
             source=source,
-            data=data
+            data=data,
+            timestamp_mono=time.monotonic()
         )
         
         # Log emergency
         self.emergency_history.append(event)
+        self._recent_event_times.append(event.timestamp_mono)
+        self._count_recent_events(event.timestamp_mono)  # Keep the window bounded between reports
         self.current_emergency = event
         
         # Set emergency level
-        severity_levels = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
-        self.emergency_level = severity_levels.get(severity, 3)
+        self.emergency_level = _SEVERITY_LEVEL.get(severity, 3)
         
         self.logger.critical(f"EMERGENCY TRIGGERED: {emergency_type.value} - {message}")
+        self.security_logger.critical(
+            f"EMERGENCY: {emergency_type.value} severity={severity} source={source} - {message}"
+        )
         
         # Execute emergency procedure
-        if emergency_type in self.emergency_procedures:
-            await self.emergency_procedures[emergency_type](event)
+        if isinstance(emergency_type, EmergencyType):
+            await self._procs[emergency_type.index](event)
         else:
             await self._default_emergency_procedure(event)
         
@@ -130,16 +230,14 @@ class EmergencyStop:
         self.logger.critical("🚨 GAS LEAK EMERGENCY PROTOCOL ACTIVATED")
         
         # Immediate actions
-        await self._stop_all_movement()
-        await self._activate_ventilation()  # If available
-        await self._trigger_evacuation_alert()
+        await self._run_concurrently(
+            self._stop_all_movement(),
+            self._activate_ventilation(),  # If available
+            self._trigger_evacuation_alert()
+        )
         
         # Voice announcement
-        if self.robot_controller and hasattr(self.robot_controller, 'speak'):
-            await self.robot_controller.speak(
-                "EMERGENCY: Gas leak detected! Evacuating area immediately! "
-                "All personnel must leave the lab now!"
-            )
+        await self._speak(self._ANNOUNCEMENTS[event.event_type])
         
         # Log critical event
         self.logger.critical(f"Gas leak emergency: {event.data}")
@@ -151,16 +249,14 @@ class EmergencyStop:
         self.logger.critical("🔥 FIRE EMERGENCY PROTOCOL ACTIVATED")
         
         # Immediate actions
-        await self._stop_all_movement()
-        await self._shutdown_electrical_systems()
-        await self._trigger_fire_alarm()
+        await self._run_concurrently(
+            self._stop_all_movement(),
+            self._shutdown_electrical_systems(),
+            self._trigger_fire_alarm()
+        )
         
         # Voice announcement
-        if self.robot_controller and hasattr(self.robot_controller, 'speak'):
-            await self.robot_controller.speak(
-                "FIRE EMERGENCY! Evacuate immediately! "
-                "Exit the building using the nearest safe exit!"
-            )
+        await self._speak(self._ANNOUNCEMENTS[event.event_type])
     
     async def _handle_security_breach(self, event: EmergencyEvent):
         """Handle security breach"""
@@ -169,16 +265,14 @@ class EmergencyStop:
         self.logger.critical("🔐 SECURITY BREACH PROTOCOL ACTIVATED")
         
         # Security actions
-        await self._lock_down_systems()
-        await self._start_security_recording()
-        await self._alert_security_personnel()
+        await self._run_concurrently(
+            self._lock_down_systems(),
+            self._start_security_recording(),
+            self._alert_security_personnel()
+        )
         
         # Voice announcement
-        if self.robot_controller and hasattr(self.robot_controller, 'speak'):
-            await self.robot_controller.speak(
-                "Security alert: Unauthorized personnel detected. "
-                "Security has been notified."
-            )
+        await self._speak(self._ANNOUNCEMENTS[event.event_type])
     
     async def _handle_hardware_failure(self, event: EmergencyEvent):
         """Handle critical hardware failure"""
@@ -186,16 +280,12 @@ class EmergencyStop:
         
         self.logger.critical("⚡ HARDWARE FAILURE EMERGENCY")
         
-        # Safe shutdown procedures
+        # Safe shutdown procedures (stop before shutting down)
         await self._stop_all_movement()
         await self._safe_shutdown_sequence()
         
         # Voice announcement
-        if self.robot_controller and hasattr(self.robot_controller, 'speak'):
-            await self.robot_controller.speak(
-                "Critical hardware failure detected. "
-                "Entering safe mode. Please check system status."
-            )
+        await self._speak(self._ANNOUNCEMENTS[event.event_type])
     
     async def _handle_user_emergency(self, event: EmergencyEvent):
         """Handle user-triggered emergency"""
@@ -204,15 +294,13 @@ class EmergencyStop:
         self.logger.critical("👤 USER EMERGENCY ACTIVATED")
         
         # User emergency actions
-        await self._stop_all_movement()
-        await self._alert_emergency_contacts()
+        await self._run_concurrently(
+            self._stop_all_movement(),
+            self._alert_emergency_contacts()
+        )
         
         # Voice announcement
-        if self.robot_controller and hasattr(self.robot_controller, 'speak'):
-            await self.robot_controller.speak(
-                "User emergency activated. Help is being contacted. "
-                "Please stay calm and follow safety procedures."
-            )
+        await self._speak(self._ANNOUNCEMENTS[event.event_type])
     
     async def _handle_system_critical(self, event: EmergencyEvent):
         """Handle critical system error"""
@@ -220,16 +308,12 @@ class EmergencyStop:
         
         self.logger.critical("💻 CRITICAL SYSTEM ERROR")
         
-        # System protection
+        # System protection (backup must finish before shutdown)
         await self._emergency_data_backup()
         await self._controlled_shutdown()
         
         # Voice announcement
-        if self.robot_controller and hasattr(self.robot_controller, 'speak'):
-            await self.robot_controller.speak(
-                "Critical system error. Initiating emergency shutdown. "
-                "Data is being protected."
-            )
+        await self._speak(self._ANNOUNCEMENTS[event.event_type])
     
     async def _handle_manual_stop(self, event: EmergencyEvent):
         """Handle manual emergency stop"""
@@ -238,14 +322,13 @@ class EmergencyStop:
         self.logger.warning("🛑 MANUAL EMERGENCY STOP")
         
         # Immediate stop
-        await self._stop_all_movement()
-        await self._pause_all_operations()
+        await self._run_concurrently(
+            self._stop_all_movement(),
+            self._pause_all_operations()
+        )
         
         # Voice announcement
-        if self.robot_controller and hasattr(self.robot_controller, 'speak'):
-            await self.robot_controller.speak(
-                "Manual emergency stop activated. All operations paused."
-            )
+        await self._speak(self._ANNOUNCEMENTS[event.event_type])
     
     async def _default_emergency_procedure(self, event: EmergencyEvent):
         """Default emergency procedure for unknown types"""
@@ -254,17 +337,23 @@ class EmergencyStop:
         self.logger.critical(f"UNKNOWN EMERGENCY TYPE: {event.event_type}")
         
         # Safe defaults
-        await self._stop_all_movement()
-        await self._alert_all_systems()
+        await self._run_concurrently(
+            self._stop_all_movement(),
+            self._alert_all_systems()
+        )
+    
+    async def _run_concurrently(self, *actions):
+        """Run independent emergency actions together so the slowest, not the sum, sets the latency"""
+        results = await asyncio.gather(*actions, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in emergency action: {result}")
     
     async def _stop_all_movement(self):
         """Immediately stop all robot movement"""
         try:
-            if self.robot_controller:
-                if hasattr(self.robot_controller, 'motor_controller'):
-                    await self.robot_controller.motor_controller.emergency_stop()
-                if hasattr(self.robot_controller, 'navigation_manager'):
-                    await self.robot_controller.navigation_manager.emergency_stop()
+            await self._collaborator('motor_controller').emergency_stop()
+            await self._collaborator('navigation_manager').emergency_stop()
             
             self.logger.info("All movement stopped")
         except Exception as e:
@@ -353,12 +442,14 @@ class EmergencyStop:
             'data': event.data
         }
         
-        # Call all alert callbacks
-        for callback in self.alert_callbacks:
-            try:
-                await callback(alert_data)
-            except Exception as e:
-                self.logger.error(f"Error in alert callback: {e}")
+        # Call all alert callbacks concurrently so one slow callback doesn't delay the rest
+        results = await asyncio.gather(
+            *(callback(alert_data) for callback in self.alert_callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in alert callback: {result}")
     
     async def reset_emergency(self):
         """Reset emergency state after resolution"""
@@ -370,10 +461,9 @@ class EmergencyStop:
             self.current_emergency = None
             
             # Voice announcement
-            if self.robot_controller and hasattr(self.robot_controller, 'speak'):
-                await self.robot_controller.speak(
-                    "Emergency state cleared. Systems returning to normal operation."
-                )
+            await self._speak(
+                "Emergency state cleared. Systems returning to normal operation."
+            )
     
     def is_emergency_active(self) -> bool:
         """Check if emergency is currently active"""
@@ -389,15 +479,22 @@ class EmergencyStop:
     
     def get_emergency_history(self, limit: int = 50) -> List[EmergencyEvent]:
         """Get emergency history"""
-        return self.emergency_history[-limit:]
+        history = self.emergency_history
+        return list(islice(history, max(0, len(history) - limit), None))
+    
+    def _count_recent_events(self, now: float) -> int:
+        """Drop trigger times older than 24h and return how many remain"""
+        cutoff = now - 86400
+        while self._recent_event_times and self._recent_event_times[0] < cutoff:
+            self._recent_event_times.popleft()
+        return len(self._recent_event_times)
     
     def get_status_report(self) -> str:
         """Get human-readable status report"""
         if not self.emergency_active:
-            recent_emergencies = len([e for e in self.emergency_history 
-                                    if (datetime.now() - e.timestamp).days < 1])
+            recent_emergencies = self._count_recent_events(time.monotonic())
             return f"✅ No active emergencies. {recent_emergencies} events in last 24h."
         else:
             event = self.current_emergency
-            duration = (datetime.now() - event.timestamp).total_seconds()
+            duration = time.monotonic() - event.timestamp_mono
             return f"🚨 ACTIVE EMERGENCY: {event.event_type.value} ({duration:.0f}s ago) - {event.message}"
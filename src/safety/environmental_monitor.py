@@ -7,30 +7,27 @@ core Jarvis environmental monitoring capabilities.
 """
 
 import asyncio
-import logging
+import functools
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
-# Sensor libraries for Raspberry Pi
-try:
-    import adafruit_dht
-    import board
-    DHT_AVAILABLE = True
-except ImportError:
-    DHT_AVAILABLE = False
+import numpy as np
 
+# Optional JIT for the statistics reduction
 try:
-    import busio
-    import adafruit_ads1x15.ads1115 as ADS
-    from adafruit_ads1x15.analog_in import AnalogIn
-    ADS_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    ADS_AVAILABLE = False
+    NUMBA_AVAILABLE = False
+
+# Sensor libraries for Raspberry Pi are imported on first use (see _load_dht/_load_ads)
 
 from ..config.settings import Config
 from ..utils.logger import get_logger
+from ..utils.logging import get_environmental_logger, get_security_logger
+from ..utils.compat import DATACLASS_SLOTS
 
 class AlertLevel(Enum):
     """Environmental alert levels"""
@@ -39,7 +36,14 @@ class AlertLevel(Enum):
     CRITICAL = "critical"
     EMERGENCY = "emergency"
 
-@dataclass
+# Alert levels indexed by their integer severity (0 = normal ... 3 = emergency)
+ALERT_LEVELS = (AlertLevel.NORMAL, AlertLevel.WARNING, AlertLevel.CRITICAL, AlertLevel.EMERGENCY)
+
+# Threshold attributes accepted by EnvironmentalMonitor.set_thresholds
+ALERT_THRESHOLDS = ('temp_warning', 'temp_critical', 'humidity_warning',
+                    'humidity_critical', 'aqi_warning', 'aqi_critical')
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EnvironmentalReading:
     """Single environmental measurement"""
     timestamp: float
@@ -50,6 +54,70 @@ class EnvironmentalReading:
     light_level: Optional[float] = None
     noise_level: Optional[float] = None
     
+@functools.lru_cache(maxsize=None)
+def _load_dht():
+    """Import the DHT22 driver once; returns (adafruit_dht, board_pins) or None if unavailable"""
+    try:
+        import adafruit_dht
+        import board
+    except ImportError:
+        return None
+    # GPIO number -> board pin object, for the D0..D27 pins this board exposes
+    board_pins = {i: getattr(board, f"D{i}") for i in range(28) if hasattr(board, f"D{i}")}
+    return adafruit_dht, board_pins
+
+@functools.lru_cache(maxsize=None)
+def _load_ads():
+    """Import the ADS1115 driver once; returns (board, busio, ADS, AnalogIn) or None if unavailable"""
+    try:
+        import board
+        import busio
+        import adafruit_ads1x15.ads1115 as ADS
+        from adafruit_ads1x15.analog_in import AnalogIn
+    except ImportError:
+        return None
+    return board, busio, ADS, AnalogIn
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _history_stats(temp, hum):
+        """Single pass over temperature/humidity; returns (count, min, max, sum) for each, NaN skipped"""
+        t_cnt = h_cnt = 0
+        t_min = t_max = t_sum = h_min = h_max = h_sum = 0.0
+        for i in range(temp.size):
+            v = temp[i]
+            if v == v:  # not NaN
+                if t_cnt == 0 or v < t_min:
+                    t_min = v
+                if t_cnt == 0 or v > t_max:
+                    t_max = v
+                t_sum += v
+                t_cnt += 1
+            v = hum[i]
+            if v == v:
+                if h_cnt == 0 or v < h_min:
+                    h_min = v
+                if h_cnt == 0 or v > h_max:
+                    h_max = v
+                h_sum += v
+                h_cnt += 1
+        return t_cnt, t_min, t_max, t_sum, h_cnt, h_min, h_max, h_sum
+else:
+    def _history_stats(temp, hum):
+        """Temperature/humidity (count, min, max, sum) for each, NaN skipped"""
+        result = ()
+        for values in (temp, hum):
+            valid = values[~np.isnan(values)]
+            if valid.size:
+                result += (valid.size, valid.min(), valid.max(), valid.sum(dtype=np.float64))
+            else:
+                result += (0, 0.0, 0.0, 0.0)
+        return result
+
+def _csv_value(value: Optional[float]) -> str:
+    """Format an optional reading value for a CSV field"""
+    return '' if value is None else str(value)
+
 class EnvironmentalMonitor:
     """
     Monitors environmental conditions for safety and optimization
@@ -64,30 +132,49 @@ class EnvironmentalMonitor:
     
     def __init__(self, config: Config):
         self.logger = get_logger(__name__)
+        self.env_logger = get_environmental_logger()
+        self.security_logger = get_security_logger()
         self.config = config
         
         # Hardware components
         self.dht_sensor = None
         self.ads_converter = None
+        self._air_quality_chan = None
+        self._light_chan = None
         
         # Monitoring state
         self.is_monitoring = False
         self.current_readings = None
         self.alert_level = AlertLevel.NORMAL
         
-        # Data storage
-        self.readings_history: List[EnvironmentalReading] = []
+        # Data storage: fixed-size ring buffer, one array per field
         self.max_history = 1000  # Keep last 1000 readings
+        self._ts = np.empty(self.max_history, dtype=np.float64)
+        self._temp = np.full(self.max_history, np.nan, dtype=np.float32)
+        self._hum = np.full(self.max_history, np.nan, dtype=np.float32)
+        self._aqi = np.full(self.max_history, np.nan, dtype=np.float32)
+        self._light = np.full(self.max_history, np.nan, dtype=np.float32)
+        self._levels = np.zeros(self.max_history, dtype=np.int8)  # Alert severity per reading
+        self._idx = 0  # Next write position
+        self._filled = False  # True once the buffer has wrapped
+        self._write_count = 0  # Total readings stored, used as the statistics cache key
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_key = -1
         
         # Alert thresholds
         self.temp_warning = 35.0  # °C
         self.temp_critical = 40.0  # °C
         self.humidity_warning = 80.0  # %
         self.humidity_critical = 90.0  # %
+        self.aqi_warning = 60
+        self.aqi_critical = 80
+        
+        self._build_severity()
         
-        # Monitoring intervals
+        # Monitoring interval; request_reading() wakes the loop early
         self.monitor_interval = 30.0  # seconds
-        self.alert_check_interval = 5.0  # seconds
+        self._reading_requested: Optional[asyncio.Event] = None
+        
         
     async def initialize(self):
         """Initialize environmental monitoring hardware"""
@@ -95,11 +182,11 @@ class EnvironmentalMonitor:
         
         try:
             # Initialize DHT22 temperature/humidity sensor
-            if DHT_AVAILABLE and self.config.hardware_enabled:
+            if self.config.hardware_enabled and _load_dht():
                 self._initialize_dht_sensor()
             
             # Initialize ADC for analog sensors
-            if ADS_AVAILABLE and self.config.hardware_enabled:
+            if self.config.hardware_enabled and _load_ads():
                 self._initialize_adc()
             
             self.logger.info("✅ Environmental monitoring initialized")
@@ -110,8 +197,9 @@ class EnvironmentalMonitor:
     
     def _initialize_dht_sensor(self):
         """Initialize DHT22 temperature and humidity sensor"""
+        adafruit_dht, board_pins = _load_dht()
         try:
-            pin = getattr(board, f"D{self.config.gpio_pins.get('dht22_pin', 4)}")
+            pin = board_pins[self.config.gpio_pins.get('dht22_pin', 4)]
             self.dht_sensor = adafruit_dht.DHT22(pin)
             self.logger.info("✅ DHT22 sensor initialized")
         except Exception as e:
@@ -120,9 +208,14 @@ class EnvironmentalMonitor:
     
     def _initialize_adc(self):
         """Initialize ADC for analog environmental sensors"""
+        board, busio, ADS, AnalogIn = _load_ads()
         try:
             i2c = busio.I2C(board.SCL, board.SDA)
             self.ads_converter = ADS.ADS1115(i2c)
+            
+            # Channel readers are reused for every sample
+            self._air_quality_chan = AnalogIn(self.ads_converter, ADS.P0)  # MQ-135 or similar
+            self._light_chan = AnalogIn(self.ads_converter, ADS.P1)
             self.logger.info("✅ ADS1115 ADC initialized")
         except Exception as e:
             self.logger.warning(f"Could not initialize ADC: {e}")
@@ -137,19 +230,22 @@ class EnvironmentalMonitor:
         self.is_monitoring = True
         self.logger.info("🔄 Starting environmental monitoring loop")
         
-        # Start monitoring tasks
-        monitor_task = asyncio.create_task(self._monitoring_loop())
-        alert_task = asyncio.create_task(self._alert_checking_loop())
-        
-        await asyncio.gather(monitor_task, alert_task)
+        self._reading_requested = asyncio.Event()
+        await self._monitoring_loop()
     
     async def stop_monitoring(self):
         """Stop environmental monitoring"""
         self.is_monitoring = False
+        self.request_reading()  # Wake the loop so it exits promptly
         self.logger.info("⏹️ Stopping environmental monitoring")
     
+    def request_reading(self):
+        """Wake the monitoring loop for an immediate reading (e.g. from a sensor threshold interrupt)"""
+        if self._reading_requested is not None:
+            self._reading_requested.set()
+    
     async def _monitoring_loop(self):
-        """Main monitoring loop"""
+        """Main monitoring loop: take a reading, then check alerts against it"""
         while self.is_monitoring:
             try:
                 reading = await self._take_reading()
@@ -157,39 +253,55 @@ class EnvironmentalMonitor:
                     self.current_readings = reading
                     self._store_reading(reading)
                     self._log_reading(reading)
-                
-                await asyncio.sleep(self.monitor_interval)
-                
-            except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(5)  # Brief pause before retry
-    
-    async def _alert_checking_loop(self):
-        """Check for environmental alerts"""
-        while self.is_monitoring:
-            try:
-                if self.current_readings:
-                    new_alert_level = self._assess_alert_level(self.current_readings)
                     
+                    # Severity was computed when the reading was stored
+                    new_alert_level = ALERT_LEVELS[self._levels[self._idx - 1]]
                     if new_alert_level != self.alert_level:
                         await self._handle_alert_change(self.alert_level, new_alert_level)
                         self.alert_level = new_alert_level
                 
-                await asyncio.sleep(self.alert_check_interval)
+                try:
+                    await asyncio.wait_for(self._reading_requested.wait(), self.monitor_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._reading_requested.clear()
                 
             except Exception as e:
-                self.logger.error(f"Error in alert checking: {e}")
-                await asyncio.sleep(2)
+                self.logger.error(f"Error in monitoring loop: {e}")
+                await asyncio.sleep(5)  # Brief pause before retry
     
     async def _take_reading(self) -> Optional[EnvironmentalReading]:
         """Take a complete environmental reading"""
-        reading = EnvironmentalReading(timestamp=time.time())
+        timestamp = time.time()
+        
+        # DHT and I2C reads block on the bus; do them all in one worker-thread hop
+        if self.dht_sensor or self.ads_converter:
+            temperature_c, humidity_percent, air_quality_index, light_level = await asyncio.to_thread(
+                self._blocking_sensor_read
+            )
+        else:
+            temperature_c = humidity_percent = air_quality_index = light_level = None
+        
+        if temperature_c is None and humidity_percent is None and air_quality_index is None:
+            return None
+        
+        return EnvironmentalReading(
+            timestamp=timestamp,
+            temperature_c=temperature_c,
+            humidity_percent=humidity_percent,
+            air_quality_index=air_quality_index,
+            light_level=light_level
+        )
+    
+    def _blocking_sensor_read(self) -> tuple:
+        """Read DHT22 and ADC channels (blocking); returns (temperature, humidity, aqi, light)"""
+        temperature_c = humidity_percent = air_quality_index = light_level = None
         
         # Read temperature and humidity
         if self.dht_sensor:
             try:
-                reading.temperature_c = self.dht_sensor.temperature
-                reading.humidity_percent = self.dht_sensor.humidity
+                temperature_c = self.dht_sensor.temperature
+                humidity_percent = self.dht_sensor.humidity
             except RuntimeError as e:
                 # DHT sensors can be finicky
                 self.logger.debug(f"DHT reading error: {e}")
@@ -198,65 +310,80 @@ class EnvironmentalMonitor:
         if self.ads_converter:
             try:
                 # Air quality sensor (MQ-135 or similar)
-                chan0 = AnalogIn(self.ads_converter, ADS.P0)
-                reading.air_quality_index = int(chan0.value / 655.35)  # Convert to 0-100 scale
+                air_quality_index = int(self._air_quality_chan.value / 655.35)  # Convert to 0-100 scale
                 
                 # Light sensor
-                chan1 = AnalogIn(self.ads_converter, ADS.P1)
-                reading.light_level = chan1.voltage
+                light_level = self._light_chan.voltage
                 
             except Exception as e:
                 self.logger.debug(f"ADC reading error: {e}")
         
-        return reading if any([
-            reading.temperature_c is not None,
-            reading.humidity_percent is not None,
-            reading.air_quality_index is not None
-        ]) else None
+        return temperature_c, humidity_percent, air_quality_index, light_level
     
     def _store_reading(self, reading: EnvironmentalReading):
-        """Store reading in history"""
-        self.readings_history.append(reading)
+        """Store reading in the history ring buffer (missing values become NaN)"""
+        i = self._idx
+        self._ts[i] = reading.timestamp
+        self._temp[i] = np.nan if reading.temperature_c is None else reading.temperature_c
+        self._hum[i] = np.nan if reading.humidity_percent is None else reading.humidity_percent
+        self._aqi[i] = np.nan if reading.air_quality_index is None else reading.air_quality_index
+        self._light[i] = np.nan if reading.light_level is None else reading.light_level
+        self._levels[i] = self._reading_severity(reading)
         
-        # Trim history if too long
-        if len(self.readings_history) > self.max_history:
-            self.readings_history = self.readings_history[-self.max_history:]
+        self._idx = (i + 1) % self.max_history
+        if self._idx == 0:
+            self._filled = True
+        self._write_count += 1
+    
+    @property
+    def history_size(self) -> int:
+        """Number of readings currently held in history"""
+        return self.max_history if self._filled else self._idx
     
     def _log_reading(self, reading: EnvironmentalReading):
-        """Log reading to environmental log"""
-        log_data = {
-            'timestamp': reading.timestamp,
-            'temperature_c': reading.temperature_c,
-            'humidity_percent': reading.humidity_percent,
-            'air_quality_index': reading.air_quality_index,
-            'light_level': reading.light_level
-        }
+        """Log reading to the environmental log as a CSV line (batched to disk by the handler)"""
+        # timestamp,temperature_c,humidity_percent,air_quality_index,light_level
+        self.env_logger.info(
+            "%.3f,%s,%s,%s,%s", reading.timestamp, _csv_value(reading.temperature_c),
+            _csv_value(reading.humidity_percent), _csv_value(reading.air_quality_index),
+            _csv_value(reading.light_level)
+        )
+    
+    def _build_severity(self):
+        """Specialise the severity checks on the current thresholds (rebuilt by set_thresholds)"""
+        tw, tc = self.temp_warning, self.temp_critical
+        hw, hc = self.humidity_warning, self.humidity_critical
+        aw, ac = self.aqi_warning, self.aqi_critical
+        
+        def reading_severity(reading: EnvironmentalReading) -> int:
+            """Worst per-channel alert severity (index into ALERT_LEVELS) for a reading"""
+            t = reading.temperature_c
+            if t is not None and t >= tc:
+                return 3
+            h = reading.humidity_percent
+            a = reading.air_quality_index
+            if (h is not None and h >= hc) or (a is not None and a >= ac):
+                return 2
+            if t is not None and t >= tw:
+                return 2
+            if (h is not None and h >= hw) or (a is not None and a >= aw):
+                return 1
+            return 0
         
-        # Use environmental logger
-        env_logger = logging.getLogger('environmental')
-        env_logger.info(f"ENV_READING: {log_data}")
+        def assess_alert_level(reading: EnvironmentalReading, _levels=ALERT_LEVELS) -> AlertLevel:
+            """Assess current environmental alert level"""
+            return _levels[reading_severity(reading)]
+        
+        self._reading_severity = reading_severity
+        self._assess_alert_level = assess_alert_level
     
-    def _assess_alert_level(self, reading: EnvironmentalReading) -> AlertLevel:
-        """Assess current environmental alert level"""
-        if reading.temperature_c is not None:
-            if reading.temperature_c >= self.temp_critical:
-                return AlertLevel.EMERGENCY
-            elif reading.temperature_c >= self.temp_warning:
-                return AlertLevel.CRITICAL
-        
-        if reading.humidity_percent is not None:
-            if reading.humidity_percent >= self.humidity_critical:
-                return AlertLevel.CRITICAL
-            elif reading.humidity_percent >= self.humidity_warning:
-                return AlertLevel.WARNING
-        
-        if reading.air_quality_index is not None:
-            if reading.air_quality_index >= 80:
-                return AlertLevel.CRITICAL
-            elif reading.air_quality_index >= 60:
-                return AlertLevel.WARNING
-        
-        return AlertLevel.NORMAL
+    def set_thresholds(self, **kwargs):
+        """Update alert thresholds"""
+        for key, value in kwargs.items():
+            if key in ALERT_THRESHOLDS:
+                setattr(self, key, value)
+                self.logger.info(f"Updated threshold {key} to {value}")
+        self._build_severity()
     
     async def _handle_alert_change(self, old_level: AlertLevel, new_level: AlertLevel):
         """Handle environmental alert level changes"""
@@ -274,8 +401,7 @@ class EnvironmentalMonitor:
         self.logger.error("🚨 ENVIRONMENTAL EMERGENCY - Initiating safety protocols")
         
         # Log emergency
-        emergency_logger = logging.getLogger('security')
-        emergency_logger.critical(f"ENVIRONMENTAL_EMERGENCY: {self.current_readings}")
+        self.security_logger.critical(f"ENVIRONMENTAL_EMERGENCY: {self.current_readings}")
         
         # Could trigger robot shutdown, alert systems, etc.
         # This would integrate with the main safety manager
@@ -285,8 +411,7 @@ class EnvironmentalMonitor:
         self.logger.warning("⚠️ Critical environmental conditions detected")
         
         # Log critical condition
-        security_logger = logging.getLogger('security')
-        security_logger.warning(f"ENVIRONMENTAL_CRITICAL: {self.current_readings}")
+        self.security_logger.warning(f"ENVIRONMENTAL_CRITICAL: {self.current_readings}")
     
     async def _handle_warning_alert(self):
         """Handle warning environmental conditions"""
@@ -309,29 +434,42 @@ class EnvironmentalMonitor:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get environmental statistics"""
-        if not self.readings_history:
+        count = self.history_size
+        if not count:
             return {"status": "no_data"}
         
-        temps = [r.temperature_c for r in self.readings_history if r.temperature_c is not None]
-        humidity = [r.humidity_percent for r in self.readings_history if r.humidity_percent is not None]
+        # Reductions only change when a new reading is stored
+        if self._stats_cache_key != self._write_count:
+            self._stats_cache = self._compute_statistics(count)
+            self._stats_cache_key = self._write_count
         
-        stats = {
-            "total_readings": len(self.readings_history),
-            "monitoring_duration_hours": (time.time() - self.readings_history[0].timestamp) / 3600,
-        }
+        # Oldest reading sits at the write index once the buffer has wrapped
+        oldest_ts = self._ts[self._idx] if self._filled else self._ts[0]
+        
+        stats = dict(self._stats_cache)
+        stats["monitoring_duration_hours"] = (time.time() - oldest_ts) / 3600
+        return stats
+    
+    def _compute_statistics(self, count: int) -> Dict[str, Any]:
+        """Reduce the history ring buffer into min/max/avg statistics"""
+        t_cnt, t_min, t_max, t_sum, h_cnt, h_min, h_max, h_sum = _history_stats(
+            self._temp[:count], self._hum[:count]
+        )
+        
+        stats = {"total_readings": count}
         
-        if temps:
+        if t_cnt:
             stats.update({
-                "temperature_min": min(temps),
-                "temperature_max": max(temps),
-                "temperature_avg": sum(temps) / len(temps)
+                "temperature_min": float(t_min),
+                "temperature_max": float(t_max),
+                "temperature_avg": float(t_sum) / t_cnt
             })
         
-        if humidity:
+        if h_cnt:
             stats.update({
-                "humidity_min": min(humidity),
-                "humidity_max": max(humidity),
-                "humidity_avg": sum(humidity) / len(humidity)
+                "humidity_min": float(h_min),
+                "humidity_max": float(h_max),
+                "humidity_avg": float(h_sum) / h_cnt
             })
         
         return stats
@@ -8,16 +8,62 @@ for lab access control.
 
 import asyncio
 import logging
+import math
+import os
 import cv2
 import face_recognition
 import numpy as np
 import pickle
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Callable
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+from ._face_kernels import squared_distances
+from ..utils.random_buffer import UniformBuffer
+from ..utils.scheduling import FixedRateTicker
+
+# Optional TFLite runtime for the SSD face detector (Edge TPU when present)
+try:
+    from tflite_runtime.interpreter import Interpreter, load_delegate
+    TFLITE_AVAILABLE = True
+except ImportError:
+    TFLITE_AVAILABLE = False
+
+# Optional FAISS index for matching against large enrolments
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# Enrolled users above which FAISS is used (below it, startup cost outweighs the scan)
+FAISS_MIN_USERS = 50
+
+# Quantised-index candidates re-ranked with exact float32 distances
+FAISS_CANDIDATES = 4
+
+# Bounded queue size between camera pipeline stages
+PIPELINE_QUEUE_SIZE = 2
+
+# Maximum face distance counted as a match (face_recognition.compare_faces default tolerance)
+MATCH_TOLERANCE = 0.6
+
+def _box_iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    """Intersection-over-union of two (top, right, bottom, left) boxes"""
+    inter_h = min(a[2], b[2]) - max(a[0], b[0])
+    inter_w = min(a[1], b[1]) - max(a[3], b[3])
+    if inter_h <= 0 or inter_w <= 0:
+        return 0.0
+    inter = inter_h * inter_w
+    area_a = (a[2] - a[0]) * (a[1] - a[3])
+    area_b = (b[2] - b[0]) * (b[1] - b[3])
+    return inter / (area_a + area_b - inter)
+
 @dataclass
 class RecognitionResult:
     """Face recognition result data"""
@@ -46,26 +92,58 @@ class FaceRecognition:
         # Recognition settings
         self.confidence_threshold = 0.6
         self.unknown_face_threshold = 5  # Consecutive unknown faces before alert
+        self.detection_threshold = 0.5  # Minimum SSD face score
+        self.track_iou_threshold = 0.6  # Box overlap to treat a face as the same as last frame
+        self.track_max_age = 2.0  # Seconds an encoding may be reused before re-encoding
         
         # State tracking
         self.known_encodings: List[np.ndarray] = []
         self.known_names: List[str] = []
+        self.known_encodings_mat = np.empty((0, 128), dtype=np.float32)  # Stacked known_encodings
+        self.known_sq_norms = np.empty(0, dtype=np.float32)  # Squared L2 norm of each row
+        self._match: Optional[Callable[[np.ndarray], Tuple[int, float]]] = None  # See _rebuild_matcher
         self.is_monitoring = False
         self.camera = None
         self.last_recognition: Optional[RecognitionResult] = None
+        self._sim_random = UniformBuffer()  # Simulation-mode dice
+        
+        # One worker per pipeline stage so capture, detection and encoding overlap
+        self._capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="face-capture")
+        self._detect_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="face-detect")
+        self._encode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="face-encode")
+        
+        # Reused quarter-size frame buffers, allocated on the first frame. RGB frames are
+        # handed to the encode stage, so keep a ring covering every frame that can be in
+        # flight: the detections queue, the one being encoded and the one waiting to enqueue
+        self._small_buf: Optional[np.ndarray] = None
+        self._rgb_bufs: List[np.ndarray] = []
+        self._rgb_index = 0
+        
+        # Faces encoded recently: (location, encoding, monotonic encode time)
+        self._face_tracks: List[Tuple[Tuple[int, int, int, int], np.ndarray, float]] = []
         
         # Security tracking
         self.unknown_face_count = 0
-        self.last_unknown_time = 0
-        self.access_log: List[Dict] = []
+        self.unknown_alert_interval_ns = 30_000_000_000  # Max one alert per 30 seconds
+        self._next_unknown_alert_ns = 0  # Monotonic time the next alert is allowed
+        self.access_log: deque = deque(maxlen=getattr(config, 'access_log_size', 10000))  # Oldest entries drop off
         
         # Paths
-        self.encodings_file = Path(config.data_dir) / "face_encodings" / "known_faces.pkl"
+        self.encodings_file = Path(config.data_dir) / "face_encodings" / "known_faces.npz"
+        self.legacy_encodings_file = self.encodings_file.with_suffix('.pkl')
         self.faces_dir = Path(config.data_dir) / "face_encodings"
         
         # Ensure directories exist
         self.faces_dir.mkdir(parents=True, exist_ok=True)
         
+        # Face detector: 'hog' (dlib) or 'tflite' (SSD MobileNet, optionally on a Coral Edge TPU)
+        self.detector_backend = getattr(config, 'face_detector_backend', 'hog')
+        self._tflite_detector = None
+        if self.detector_backend == 'tflite':
+            self._tflite_detector = self._load_tflite_detector()
+            if self._tflite_detector is None:
+                self.detector_backend = 'hog'
+        
         # Load known faces
         self._load_known_faces()
         
@@ -96,42 +174,138 @@ class FaceRecognition:
         self.is_monitoring = False
         
         if self.camera:
-            self.camera.release()
-            self.camera = None
+            # Release on the capture thread so it can't race an in-flight read
+            camera, self.camera = self.camera, None
+            await asyncio.get_running_loop().run_in_executor(self._capture_executor, camera.release)
         
         self.logger.info("Face recognition monitoring stopped")
     
     async def _monitoring_loop(self):
         """Main face recognition monitoring loop"""
+        if not self.config.simulation_mode:
+            # Real camera-based recognition
+            await self._run_camera_pipeline()
+            return
+        
+        ticker = FixedRateTicker(0.5)  # Process 2 frames per second
         while self.is_monitoring:
             try:
-                if self.config.simulation_mode:
-                    # Simulate face recognition for testing
-                    await self._simulate_recognition()
-                else:
-                    # Real camera-based recognition
-                    await self._process_camera_frame()
+                # Simulate face recognition for testing
+                await self._simulate_recognition()
                 
-                await asyncio.sleep(0.5)  # Process 2 frames per second
+                await ticker.wait()
                 
             except Exception as e:
                 self.logger.error(f"Error in face recognition loop: {e}")
                 await asyncio.sleep(1.0)
     
+    async def _run_camera_pipeline(self):
+        """Run capture -> detect -> encode as concurrent stages joined by bounded queues"""
+        cv2.setNumThreads(1)  # Stages run in parallel threads; avoid oversubscribing cores
+        
+        frames: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        detections: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        stages = [
+            asyncio.create_task(self._capture_stage(frames)),
+            asyncio.create_task(self._detect_stage(frames, detections)),
+            asyncio.create_task(self._encode_stage(detections))
+        ]
+        try:
+            await asyncio.gather(*stages)
+        finally:
+            for stage in stages:
+                stage.cancel()
+    
+    async def _capture_stage(self, frames: asyncio.Queue):
+        """Read camera frames in a worker thread; None marks the end of the stream"""
+        loop = asyncio.get_running_loop()
+        ticker = FixedRateTicker(0.5)  # Capture 2 frames per second
+        
+        while self.is_monitoring and self.camera:
+            try:
+                ret, frame = await loop.run_in_executor(self._capture_executor, self.camera.read)
+                if ret:
+                    await frames.put(frame)  # Blocks while detection is behind
+                
+                await ticker.wait()
+                
+            except Exception as e:
+                self.logger.error(f"Error capturing frame: {e}")
+                await asyncio.sleep(1.0)
+        
+        await frames.put(None)
+    
+    async def _detect_stage(self, frames: asyncio.Queue, detections: asyncio.Queue):
+        """Find face locations for each captured frame"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            frame = await frames.get()
+            if frame is None:
+                break
+            
+            try:
+                rgb_small_frame, face_locations = await loop.run_in_executor(
+                    self._detect_executor, self._detect_faces, frame
+                )
+                if face_locations:
+                    # Advance the ring only for frames handed on: the encode stage holds
+                    # at most the queued frames plus the one it is encoding
+                    self._rgb_index = (self._rgb_index + 1) % len(self._rgb_bufs)
+                    await detections.put((rgb_small_frame, face_locations))
+            except Exception as e:
+                self.logger.error(f"Error detecting faces: {e}")
+        
+        await detections.put(None)
+    
+    async def _encode_stage(self, detections: asyncio.Queue):
+        """Encode detected faces and match them against known users"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            item = await detections.get()
+            if item is None:
+                break
+            
+            rgb_small_frame, face_locations = item
+            try:
+                # Reuse encodings of faces that haven't moved; encode only the rest
+                now = time.monotonic()
+                tracked = [self._match_track(location, now) for location in face_locations]
+                missed = [location for location, track in zip(face_locations, tracked) if track is None]
+                if missed:
+                    new_encodings = iter(await loop.run_in_executor(
+                        self._encode_executor, self._encode_faces, rgb_small_frame, missed
+                    ))
+                    tracked = [track or (location, next(new_encodings), now)
+                               for location, track in zip(face_locations, tracked)]
+                
+                self._face_tracks = tracked
+                face_encodings = [encoding for _, encoding, _ in tracked]
+                
+                timestamp = datetime.now()  # Shared by every face in this frame
+                for face_encoding, face_location in zip(face_encodings, face_locations):
+                    # Scale back up face locations
+                    scaled_location = tuple(coord * 4 for coord in face_location)
+                    
+                    # Compare with known faces
+                    result = self._recognize_face(face_encoding, scaled_location, timestamp)
+                    await self._process_recognition_result(result)
+            except Exception as e:
+                self.logger.error(f"Error encoding faces: {e}")
+    
     async def _simulate_recognition(self):
         """Simulate face recognition for development"""
-        import random
-        
         # Occasionally simulate different recognition scenarios
-        scenario = random.random()
+        scenario = self._sim_random.random()
         
         if scenario < 0.7:  # 70% known user
-            user_id = random.choice(self.known_names) if self.known_names else "admin"
-            confidence = random.uniform(0.7, 0.95)
+            user_id = self._sim_random.choice(self.known_names) if self.known_names else "admin"
+            confidence = self._sim_random.uniform(0.7, 0.95)
             authorized = True
         elif scenario < 0.9:  # 20% unknown user
             user_id = None
-            confidence = random.uniform(0.3, 0.6)
+            confidence = self._sim_random.uniform(0.3, 0.6)
             authorized = False
         else:  # 10% no face detected
             return
@@ -146,56 +320,110 @@ class FaceRecognition:
         
         await self._process_recognition_result(result)
     
-    async def _process_camera_frame(self):
-        """Process camera frame for face recognition"""
-        if not self.camera:
-            return
+    def _encode_faces(self, rgb_frame: np.ndarray, face_locations: List[Tuple[int, int, int, int]]) -> List[np.ndarray]:
+        """Encode faces at known locations (blocking; runs in the encode thread)"""
+        # Single pass, 5-landmark alignment: the per-frame path favours speed
+        return face_recognition.face_encodings(rgb_frame, face_locations, num_jitters=1, model="small")
+    
+    def _match_track(self, location: Tuple[int, int, int, int], now: float):
+        """Previous-frame track overlapping location, if its encoding is still fresh"""
+        for track in self._face_tracks:
+            track_location, _, encoded_at = track
+            if (now - encoded_at < self.track_max_age and
+                    _box_iou(location, track_location) > self.track_iou_threshold):
+                return (location, track[1], encoded_at)
+        return None
+    
+    def _detect_faces(self, frame: np.ndarray) -> Tuple[np.ndarray, List[Tuple[int, int, int, int]]]:
+        """Downscale a BGR frame and find faces in it (blocking; runs in the detect thread)"""
+        height, width = frame.shape[:2]
+        small_shape = (height // 4, width // 4, 3)
+        if self._small_buf is None or self._small_buf.shape != small_shape:
+            self._small_buf = np.empty(small_shape, dtype=np.uint8)
+            self._rgb_bufs = [np.empty(small_shape, dtype=np.uint8) for _ in range(PIPELINE_QUEUE_SIZE + 2)]
         
-        ret, frame = self.camera.read()
-        if not ret:
-            return
+        # Resize frame for faster processing (area interpolation suits downscaling)
+        cv2.resize(frame, (small_shape[1], small_shape[0]), dst=self._small_buf, interpolation=cv2.INTER_AREA)
         
-        # Resize frame for faster processing
-        small_frame = cv2.resize(frame, (0, 0), fx=0.25, fy=0.25)
-        rgb_small_frame = small_frame[:, :, ::-1]  # BGR to RGB
+        # BGR to RGB into a contiguous buffer, so dlib needn't copy a negative-stride view
+        # The buffer is only reused until a frame with faces is handed on
+        rgb_small_frame = self._rgb_bufs[self._rgb_index]
+        cv2.cvtColor(self._small_buf, cv2.COLOR_BGR2RGB, dst=rgb_small_frame)
         
         # Find faces in current frame
-        face_locations = face_recognition.face_locations(rgb_small_frame)
-        face_encodings = face_recognition.face_encodings(rgb_small_frame, face_locations)
+        if self._tflite_detector is not None:
+            return rgb_small_frame, self._detect_faces_tflite(rgb_small_frame)
+        return rgb_small_frame, face_recognition.face_locations(rgb_small_frame)
+    
+    def _load_tflite_detector(self):
+        """Load the SSD face detector; returns None to fall back to HOG"""
+        if not TFLITE_AVAILABLE:
+            self.logger.warning("tflite_runtime not available - using HOG face detector")
+            return None
         
-        for face_encoding, face_location in zip(face_encodings, face_locations):
-            # Scale back up face locations
-            scaled_location = tuple(coord * 4 for coord in face_location)
+        model_path = getattr(self.config, 'face_detector_model',
+                             self.faces_dir / "ssd_mobilenet_v2_face_quant_postprocess.tflite")
+        try:
+            delegates = [load_delegate('libedgetpu.so.1')] if getattr(self.config, 'use_edgetpu', False) else None
+            interpreter = Interpreter(model_path=str(model_path), experimental_delegates=delegates)
+            interpreter.allocate_tensors()
             
-            # Compare with known faces
-            result = self._recognize_face(face_encoding, scaled_location)
-            await self._process_recognition_result(result)
+            self.logger.info(f"TFLite face detector loaded: {model_path}")
+            return interpreter
+        except Exception as e:
+            self.logger.warning(f"Could not load TFLite face detector, using HOG: {e}")
+            return None
+    
+    def _detect_faces_tflite(self, rgb_frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """Run the SSD detector; returns (top, right, bottom, left) boxes in frame pixels"""
+        interpreter = self._tflite_detector
+        input_detail = interpreter.get_input_details()[0]
+        _, input_h, input_w, _ = input_detail['shape']
+        
+        model_input = cv2.resize(rgb_frame, (input_w, input_h), interpolation=cv2.INTER_AREA)
+        if input_detail['dtype'] == np.float32:
+            model_input = (model_input.astype(np.float32) - 127.5) / 127.5
+        interpreter.set_tensor(input_detail['index'], model_input[np.newaxis])
+        interpreter.invoke()
+        
+        # SSD postprocess outputs: boxes, classes, scores, count
+        boxes_out, _, scores_out, count_out = interpreter.get_output_details()
+        boxes = interpreter.get_tensor(boxes_out['index'])[0]
+        scores = interpreter.get_tensor(scores_out['index'])[0]
+        count = int(interpreter.get_tensor(count_out['index'])[0])
+        
+        # Normalised (ymin, xmin, ymax, xmax) -> pixel (top, right, bottom, left)
+        height, width = rgb_frame.shape[:2]
+        locations = []
+        for i in range(count):
+            if scores[i] < self.detection_threshold:
+                continue
+            ymin, xmin, ymax, xmax = np.clip(boxes[i], 0.0, 1.0)
+            locations.append((int(ymin * height), int(xmax * width), int(ymax * height), int(xmin * width)))
+        return locations
     
-    def _recognize_face(self, face_encoding: np.ndarray, face_location: Tuple[int, int, int, int]) -> RecognitionResult:
+    def _recognize_face(self, face_encoding: np.ndarray, face_location: Tuple[int, int, int, int],
+                        timestamp: Optional[datetime] = None) -> RecognitionResult:
         """Recognize a face encoding against known faces"""
         user_id = None
         confidence = 0.0
         authorized = False
         
-        if len(self.known_encodings) > 0:
-            # Compare with known faces
-            matches = face_recognition.compare_faces(self.known_encodings, face_encoding)
-            face_distances = face_recognition.face_distance(self.known_encodings, face_encoding)
+        if self._match is not None:
+            best_match_index, best_sq_distance = self._match(np.ascontiguousarray(face_encoding, dtype=np.float32))
+            distance = math.sqrt(max(best_sq_distance, 0.0))
             
-            if len(face_distances) > 0:
-                best_match_index = np.argmin(face_distances)
+            if distance <= MATCH_TOLERANCE:
+                confidence = 1.0 - distance
                 
-                if matches[best_match_index]:
-                    confidence = 1.0 - face_distances[best_match_index]
-                    
-                    if confidence >= self.confidence_threshold:
-                        user_id = self.known_names[best_match_index]
-                        authorized = True
+                if confidence >= self.confidence_threshold:
+                    user_id = self.known_names[best_match_index]
+                    authorized = True
         
         return RecognitionResult(
             user_id=user_id,
             confidence=confidence,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             authorized=authorized,
             face_location=face_location
         )
@@ -206,7 +434,7 @@ class FaceRecognition:
         
         # Log access attempt
         access_entry = {
-            'timestamp': result.timestamp.isoformat(),
+            'timestamp': result.timestamp,  # Formatted in get_access_log
             'user_id': result.user_id,
             'authorized': result.authorized,
             'confidence': result.confidence
@@ -217,7 +445,8 @@ class FaceRecognition:
             # Reset unknown face counter
             self.unknown_face_count = 0
             
-            self.logger.info(f"Authorized user recognized: {result.user_id} (confidence: {result.confidence:.2f})")
+            # Per-frame messages use %-args so formatting is skipped when the level is disabled
+            self.logger.info("Authorized user recognized: %s (confidence: %.2f)", result.user_id, result.confidence)
             
             if self.alert_callback:
                 await self.alert_callback({
@@ -230,16 +459,16 @@ class FaceRecognition:
         else:
             # Handle unknown/unauthorized face
             self.unknown_face_count += 1
-            current_time = time.time()
+            now_ns = time.monotonic_ns()
             
-            self.logger.warning(f"Unknown face detected (count: {self.unknown_face_count})")
+            self.logger.warning("Unknown face detected (count: %d)", self.unknown_face_count)
             
             # Trigger security alert if too many unknown faces
             if (self.unknown_face_count >= self.unknown_face_threshold and 
-                current_time - self.last_unknown_time > 30):  # Max one alert per 30 seconds
+                now_ns >= self._next_unknown_alert_ns):
                 
                 await self._trigger_security_alert(result)
-                self.last_unknown_time = current_time
+                self._next_unknown_alert_ns = now_ns + self.unknown_alert_interval_ns
                 self.unknown_face_count = 0
     
     async def _trigger_security_alert(self, result: RecognitionResult):
@@ -269,8 +498,9 @@ class FaceRecognition:
             # Load image
             image = face_recognition.load_image_file(image_path)
             
-            # Find face encodings
-            encodings = face_recognition.face_encodings(image)
+            # Find face encodings; enrolment is one-off, so average over jittered passes.
+            # Same landmark model as recognition so embeddings stay comparable
+            encodings = face_recognition.face_encodings(image, num_jitters=10, model="small")
             
             if len(encodings) == 0:
                 self.logger.error(f"No face found in image: {image_path}")
@@ -282,6 +512,7 @@ class FaceRecognition:
             # Add to known faces
             self.known_encodings.append(encodings[0])
             self.known_names.append(user_id)
+            self._rebuild_known_matrix()
             
             # Save updated encodings
             self._save_known_faces()
@@ -300,6 +531,7 @@ class FaceRecognition:
                 index = self.known_names.index(user_id)
                 del self.known_names[index]
                 del self.known_encodings[index]
+                self._rebuild_known_matrix()
                 
                 self._save_known_faces()
                 
@@ -317,28 +549,78 @@ class FaceRecognition:
         """Load known face encodings from file"""
         try:
             if self.encodings_file.exists():
-                with open(self.encodings_file, 'rb') as f:
+                with np.load(self.encodings_file) as data:
+                    encodings = data['encodings']
+                    self.known_names = data['names'].tolist()
+                self.known_encodings = list(encodings)
+                self._rebuild_known_matrix()
+                
+                self.logger.info(f"Loaded {len(self.known_names)} known faces")
+            elif self.legacy_encodings_file.exists():
+                with open(self.legacy_encodings_file, 'rb') as f:
                     data = pickle.load(f)
                     self.known_encodings = data.get('encodings', [])
                     self.known_names = data.get('names', [])
+                self._rebuild_known_matrix()
                 
-                self.logger.info(f"Loaded {len(self.known_names)} known faces")
+                self.logger.info(f"Loaded {len(self.known_names)} known faces from legacy pickle")
+                self._save_known_faces()  # Migrate to the .npz format
             else:
                 self.logger.info("No existing face encodings found")
                 
         except Exception as e:
             self.logger.error(f"Failed to load known faces: {e}")
     
+    def _rebuild_known_matrix(self):
+        """Stack known encodings into one contiguous (N, 128) float32 matrix for matching"""
+        if self.known_encodings:
+            self.known_encodings_mat = np.ascontiguousarray(np.stack(self.known_encodings), dtype=np.float32)
+        else:
+            self.known_encodings_mat = np.empty((0, 128), dtype=np.float32)
+        self.known_sq_norms = np.einsum('ij,ij->i', self.known_encodings_mat, self.known_encodings_mat)
+        self._rebuild_matcher()
+    
+    def _rebuild_matcher(self):
+        """Specialise the best-match lookup for the current known faces"""
+        known = self.known_encodings_mat
+        sq_norms = self.known_sq_norms
+        
+        if len(known) == 0:
+            self._match = None
+        elif FAISS_AVAILABLE and len(known) > FAISS_MIN_USERS:
+            # 8-bit scalar-quantised L2 index: a quarter of the float32 bytes to scan,
+            # same metric as the linear scan
+            index = faiss.IndexScalarQuantizer(known.shape[1], faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+            index.train(known)
+            index.add(known)
+            
+            def match(query: np.ndarray) -> Tuple[int, float]:
+                # Shortlist from the int8 index, then exact distances so thresholds stay precise
+                _, candidates = index.search(query[np.newaxis], FAISS_CANDIDATES)
+                candidates = candidates[0][candidates[0] >= 0]
+                diff = known[candidates] - query
+                sq_distances = np.einsum('ij,ij->i', diff, diff)
+                best = int(sq_distances.argmin())
+                return int(candidates[best]), float(sq_distances[best])
+            
+            self._match = match
+        else:
+            def match(query: np.ndarray) -> Tuple[int, float]:
+                # Squared distances to every known face in one pass; sqrt only the best
+                sq_distances = squared_distances(known, sq_norms, query)
+                best = int(sq_distances.argmin())
+                return best, float(sq_distances[best])
+            
+            self._match = match
+    
     def _save_known_faces(self):
         """Save known face encodings to file"""
         try:
-            data = {
-                'encodings': self.known_encodings,
-                'names': self.known_names
-            }
-            
-            with open(self.encodings_file, 'wb') as f:
-                pickle.dump(data, f)
+            # Write a temp file and rename it over the old one so readers never see a partial file
+            tmp_file = self.encodings_file.with_suffix('.npz.tmp')
+            with open(tmp_file, 'wb') as f:
+                np.savez(f, encodings=self.known_encodings_mat, names=np.array(self.known_names, dtype=str))
+            os.replace(tmp_file, self.encodings_file)
             
             self.logger.info(f"Saved {len(self.known_names)} known faces")
             
@@ -359,7 +641,8 @@ class FaceRecognition:
     
     def get_access_log(self, limit: int = 100) -> List[Dict]:
         """Get recent access log entries"""
-        return self.access_log[-limit:]
+        recent = islice(self.access_log, max(0, len(self.access_log) - limit), None)
+        return [{**entry, 'timestamp': entry['timestamp'].isoformat()} for entry in recent]
     
     def get_status_report(self) -> str:
         """Get human-readable status report"""
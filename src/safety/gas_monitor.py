@@ -9,10 +9,25 @@ when dangerous levels are detected.
 import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
+from ..utils.random_buffer import UniformBuffer
+from ..utils.scheduling import FixedRateTicker
+
+# Optional SPI driver for the MCP3008 ADC
+try:
+    import spidev
+    SPIDEV_AVAILABLE = True
+except ImportError:
+    SPIDEV_AVAILABLE = False
+
+# MQ sensors read by the monitor, in ADC channel order
+GAS_SENSORS = ('mq2', 'mq5', 'mq7')
+
 @dataclass
 class GasReading:
     """Gas sensor reading data"""
@@ -50,11 +65,23 @@ class GasMonitor:
         # Monitoring state
         self.is_monitoring: bool = False
         self.last_readings: Dict[str, GasReading] = {}
-        self.alert_active: bool = False
+        self.alert_hold_ns = 10_000_000_000  # Minimum time an alert stays active
+        self._alert_until_ns: Dict[str, int] = {}  # Per sensor: monotonic time its alert expires
         self.baseline_values: Dict[str, float] = {}
+        
+        # Per-sensor arrays in GAS_SENSORS order for the vectorised PPM conversion
+        self._baselines = np.full(len(GAS_SENSORS), 100.0)
+        self._calibrated = np.ones(len(GAS_SENSORS), dtype=bool)  # False: unusable baseline, no alerts
+        self._ppm_slope = np.array([200.0, 150.0, 100.0])  # PPM per unit of (raw / baseline - 1)
+        self._ppm_thresholds = np.array([self.thresholds[sensor] for sensor in GAS_SENSORS])
 
         # Hardware simulation for development (support both SIMULATION_MODE and simulation_mode)
         self.simulation_mode: bool = getattr(config, 'simulation_mode', getattr(config, 'SIMULATION_MODE', True))
+        self._sim_random = UniformBuffer()  # Simulated noise and leak dice
+        
+        # MCP3008 ADC; sensors sit on consecutive channels from GAS_SENSOR_PIN
+        self._spi = None
+        self.adc_base_channel: int = getattr(config, 'GAS_SENSOR_PIN', 0)
 
         self.logger.info("Gas Monitor initialized")
     
@@ -63,36 +90,59 @@ class GasMonitor:
         self.is_monitoring = True
         self.logger.info("Starting gas monitoring system")
         
+        if not self.simulation_mode:
+            self._open_adc()
+        
         # Calibrate sensors on startup
         await self.calibrate_sensors()
         
         # Start monitoring loop
         asyncio.create_task(self._monitoring_loop())
     
+    @property
+    def alert_active(self) -> bool:
+        """True while any sensor's gas alert is within its minimum active duration"""
+        now_ns = time.monotonic_ns()
+        return any(now_ns < until_ns for until_ns in self._alert_until_ns.values())
+    
     async def stop_monitoring(self):
         """Stop gas monitoring"""
         self.is_monitoring = False
+        
+        if self._spi is not None:
+            self._spi.close()
+            self._spi = None
+        
         self.logger.info("Gas monitoring stopped")
     
     async def calibrate_sensors(self):
         """Calibrate gas sensors to baseline values"""
         self.logger.info("Calibrating gas sensors...")
         
-        # Take baseline readings
-        for sensor in ['mq2', 'mq5', 'mq7']:
-            readings = []
-            for _ in range(10):
-                value = await self._read_sensor(sensor)
-                readings.append(value)
-                await asyncio.sleep(0.1)
-            
-            self.baseline_values[sensor] = sum(readings) / len(readings)
+        # Take baseline readings: each round samples all sensors concurrently
+        samples = np.empty((10, len(GAS_SENSORS)), dtype=np.float64)
+        for i in range(len(samples)):
+            samples[i] = await self._sample_sensors()
+            if not self.simulation_mode:
+                await asyncio.sleep(0.1)  # Spread hardware samples over time to average out noise
+        
+        baselines = samples.mean(axis=0)
+        for sensor, baseline in zip(GAS_SENSORS, baselines):
+            self.baseline_values[sensor] = float(baseline)
             self.logger.info(f"Sensor {sensor} baseline: {self.baseline_values[sensor]:.2f}")
         
+        # A zero or non-finite baseline (ADC error, disconnected sensor) can't scale readings
+        self._calibrated = np.isfinite(baselines) & (baselines > 0)
+        for sensor, calibrated in zip(GAS_SENSORS, self._calibrated.tolist()):
+            if not calibrated:
+                self.logger.error(f"Sensor {sensor} calibration failed - alerts disabled for it")
+        self._baselines = np.where(self._calibrated, baselines, 1.0)
+        
         self.logger.info("Gas sensor calibration complete")
     
     async def _monitoring_loop(self):
         """Main monitoring loop"""
+        ticker = FixedRateTicker(1.0)  # Monitor every second
         while self.is_monitoring:
             try:
                 # Read all gas sensors
@@ -108,7 +158,7 @@ class GasMonitor:
                 # Log readings periodically
                 await self._log_readings(readings)
                 
-                await asyncio.sleep(1.0)  # Monitor every second
+                await ticker.wait()
                 
             except Exception as e:
                 self.logger.error(f"Error in gas monitoring loop: {e}")
@@ -116,39 +166,78 @@ class GasMonitor:
     
     async def _read_all_sensors(self) -> Dict[str, GasReading]:
         """Read all gas sensors"""
-        readings = {}
+        raw = await self._sample_sensors()
         
-        for sensor in ['mq2', 'mq5', 'mq7']:
-            value = await self._read_sensor(sensor)
-            ppm = self._convert_to_ppm(sensor, value)
-            
-            threshold = self.thresholds.get(sensor, self.thresholds['general'])
-            is_dangerous = ppm > threshold
-            threshold_exceeded = ppm > (threshold * 0.8)  # Warning at 80%
-            
+        # Simple linear approximation (real sensors need logarithmic curves)
+        # Uncalibrated sensors report NaN PPM, which never crosses a threshold
+        ppm = np.maximum(0.0, (raw / self._baselines - 1.0) * self._ppm_slope)
+        ppm[~self._calibrated] = np.nan
+        is_dangerous = ppm > self._ppm_thresholds
+        threshold_exceeded = ppm > (self._ppm_thresholds * 0.8)  # Warning at 80%
+        
+        now = datetime.now()  # One timestamp for the whole tick
+        readings = {}
+        for sensor, value, sensor_ppm, dangerous, exceeded in zip(
+                GAS_SENSORS, raw.tolist(), ppm.tolist(), is_dangerous.tolist(), threshold_exceeded.tolist()):
             readings[sensor] = GasReading(
                 sensor_type=sensor,
                 value=value,
-                ppm=ppm,
-                timestamp=datetime.now(),
-                is_dangerous=is_dangerous,
-                threshold_exceeded=threshold_exceeded
+                ppm=sensor_ppm,
+                timestamp=now,
+                is_dangerous=dangerous,
+                threshold_exceeded=exceeded
             )
         
         return readings
     
+    async def _sample_sensors(self) -> np.ndarray:
+        """Raw value of every sensor, in GAS_SENSORS order"""
+        if self._spi is None:
+            return np.array(await asyncio.gather(*(self._read_sensor(sensor) for sensor in GAS_SENSORS)))
+        
+        try:
+            # All channels in one worker-thread hop, off the event loop
+            return np.array(await asyncio.to_thread(self._read_adc_channels), dtype=np.float64)
+        except Exception as e:
+            self.logger.error(f"Error reading gas sensor ADC: {e}")
+            return np.zeros(len(GAS_SENSORS))
+    
+    def _open_adc(self):
+        """Open the MCP3008 on SPI0/CE0; without it, hardware reads use placeholder values"""
+        if not SPIDEV_AVAILABLE:
+            self.logger.warning("spidev not available - gas sensor ADC disabled")
+            return
+        
+        try:
+            spi = spidev.SpiDev()
+            spi.open(0, 0)
+            spi.max_speed_hz = 1_350_000
+            self._spi = spi
+            self.logger.info("MCP3008 gas sensor ADC opened")
+        except Exception as e:
+            self.logger.warning(f"Could not open gas sensor ADC: {e}")
+    
+    def _read_adc_channels(self) -> List[int]:
+        """Read each gas sensor channel from the MCP3008 (blocking; 10-bit values)"""
+        values = []
+        for i in range(len(GAS_SENSORS)):
+            # Start bit, single-ended channel select, then clock out the result. The MCP3008
+            # needs CS raised between conversions, so each channel is its own transfer
+            rx = self._spi.xfer2([1, (8 + self.adc_base_channel + i) << 4, 0])
+            values.append(((rx[1] & 3) << 8) | rx[2])
+        return values
+    
     async def _read_sensor(self, sensor: str) -> float:
         """Read individual gas sensor"""
         if self.simulation_mode:
             # Simulate gas sensor readings
-            import random
             base_value = 100.0
-            noise = random.uniform(-10, 10)
+            noise = self._sim_random.uniform(-10, 10)
             
             # Occasionally simulate a gas leak for testing
-            if random.random() < 0.001:  # 0.1% chance
-                leak_value = random.uniform(400, 800)
-                self.logger.warning(f"SIMULATION: Gas leak detected on {sensor}")
+            if self._sim_random.random() < 0.001:  # 0.1% chance
+                leak_value = self._sim_random.uniform(400, 800)
+                self.logger.warning("SIMULATION: Gas leak detected on %s", sensor)
                 return leak_value
             
             return base_value + noise
@@ -162,30 +251,19 @@ class GasMonitor:
                 self.logger.error(f"Error reading {sensor}: {e}")
                 return 0.0
     
-    def _convert_to_ppm(self, sensor: str, raw_value: float) -> float:
-        """Convert raw sensor value to PPM"""
-        # Simplified conversion - would need proper calibration
-        # for real deployment with specific MQ sensor curves
-        
-        baseline = self.baseline_values.get(sensor, 100.0)
-        ratio = raw_value / baseline
-        
-        # Simple linear approximation (real sensors need logarithmic curves)
-        if sensor == 'mq2':  # Smoke/combustible
-            ppm = (ratio - 1.0) * 200
-        elif sensor == 'mq5':  # Natural gas
-            ppm = (ratio - 1.0) * 150
-        elif sensor == 'mq7':  # Carbon monoxide
-            ppm = (ratio - 1.0) * 100
-        else:
-            ppm = (ratio - 1.0) * 100
-        
-        return max(0, ppm)  # Ensure positive values
+    def set_threshold(self, sensor: str, ppm: float):
+        """Update a sensor's alert threshold (PPM)"""
+        self.thresholds[sensor] = ppm
+        self._ppm_thresholds = np.array([self.thresholds[s] for s in GAS_SENSORS])
+        self.logger.info(f"Updated {sensor} threshold to {ppm} PPM")
     
     async def _trigger_gas_alert(self, reading: GasReading):
         """Trigger gas leak alert"""
-        if not self.alert_active:
-            self.alert_active = True
+        # Suppress repeats per sensor, so an active MQ2 alert can't mask a new MQ7 (CO) one
+        now_ns = time.monotonic_ns()
+        if now_ns >= self._alert_until_ns.get(reading.sensor_type, 0):
+            # Keep alert active for minimum duration
+            self._alert_until_ns[reading.sensor_type] = now_ns + self.alert_hold_ns
             
             alert_message = (
                 f"🚨 GAS LEAK DETECTED! 🚨\n"
@@ -207,15 +285,16 @@ class GasMonitor:
                     'message': alert_message,
                     'timestamp': reading.timestamp
                 })
-            
-            # Keep alert active for minimum duration
-            await asyncio.sleep(10)
-            self.alert_active = False
     
     async def _log_readings(self, readings: Dict[str, GasReading]):
         """Log gas readings to environmental log"""
+        # Per-tick detail is debug-only; skip building it when nobody will see it
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        # Readings in a tick share one timestamp; ISO formatting is left to the log writer
         log_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': readings[GAS_SENSORS[0]].timestamp,
             'gas_readings': {}
         }
         
@@ -227,6 +306,8 @@ class GasMonitor:
                 'threshold_exceeded': reading.threshold_exceeded
             }
         
+        self.logger.debug("Gas readings: %s", log_data)
+        
         # This would write to environmental log file
         # Environmental logger handles the actual file writing
     
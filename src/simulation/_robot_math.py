@@ -0,0 +1,53 @@
+"""
+Robot geometry kernels
+
+Resolves a part offset table (offset = scale * chassis_size + pad) for
+one or many chassis sizes at once. Tables are structure-of-arrays,
+shape (3, parts), so each coordinate is one contiguous row. Uses a
+Numba-compiled loop when available, otherwise NumPy broadcasting.
+Also holds the per-step drive heading math for the enhanced simulation.
+"""
+
+import math
+
+import numpy as np
+
+# Optional JIT for large parameter sweeps
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit('f8[:, :, ::1](f8[:, ::1], f8[:, ::1], f8[:, ::1])', cache=True)
+    def part_offsets(scale, pad, chassis_sizes):
+        """Chassis-relative part offsets, shape (robots, 3, parts)"""
+        n = chassis_sizes.shape[0]
+        parts = scale.shape[1]
+        out = np.empty((n, 3, parts))
+        for r in range(n):
+            for axis in range(3):
+                size = chassis_sizes[r, axis]
+                for i in range(parts):
+                    out[r, axis, i] = scale[axis, i] * size + pad[axis, i]
+        return out
+else:
+    def part_offsets(scale, pad, chassis_sizes):
+        """Chassis-relative part offsets, shape (robots, 3, parts)"""
+        return scale[None, :, :] * chassis_sizes[:, :, None] + pad[None, :, :]
+
+
+def heading_vector(qx, qy, qz, qw, magnitude):
+    """World-frame planar vector of the given magnitude along a quaternion's heading"""
+    # Yaw direction straight from the quaternion, no Euler round-trip
+    sin_yaw = 2.0 * (qw * qz + qx * qy)
+    cos_yaw = 1.0 - 2.0 * (qy * qy + qz * qz)
+    norm = math.hypot(sin_yaw, cos_yaw)
+    if norm == 0.0:
+        norm = 1.0
+    scale = magnitude / norm
+    return (cos_yaw * scale, sin_yaw * scale, 0.0)
+
+if NUMBA_AVAILABLE:
+    heading_vector = njit('UniTuple(f8, 3)(f8, f8, f8, f8, f8)', cache=True, fastmath=True)(heading_vector)
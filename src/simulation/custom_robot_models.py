@@ -4,398 +4,700 @@ Custom Robot Models for Sarus Robot Simulation
 Easy-to-modify robot designs for different use cases
 """
 
-import pybullet as p
+from __future__ import annotations
+
+import functools
+import os
+import tempfile
 import numpy as np
-from typing import List, Tuple, Dict
+from collections import defaultdict
+from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Tuple
+
+from ._robot_math import part_offsets
+
+# A fixed-joint child of the chassis: (mass, collision shape, visual shape, offset).
+# Visual-only parts (collision -1) are decorative and must stay massless: a mass
+# without a collider only adds integration work and cannot touch anything.
+# Aliases are evaluated at runtime, so they keep the typing generics for Python < 3.9.
+Part = Tuple[float, int, int, List[float]]
+
+# Everything needed to instantiate a robot: (base mass, base collision, base visual, parts)
+Body = Tuple[float, int, int, List[Part]]
+
+# Wheel collider detail: 'exact' cylinder, 'box' bounding box, or 'fast' sphere.
+# Visuals stay cylinders at every level.
+COLLISION_LODS = ('exact', 'box', 'fast')
+
+# URDF templates for models that can be loaded natively in one call
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+
+@functools.lru_cache(maxsize=None)
+def _pb():
+    """Import pybullet on first use, so presets and model listing stay cheap to import"""
+    import pybullet
+    return pybullet
+
+@functools.lru_cache(maxsize=None)
+def _read_template(name: str) -> str:
+    """Read a URDF template once"""
+    return (TEMPLATE_DIR / name).read_text()
+
+def _xyz(values) -> str:
+    """Space-separated vector for a URDF attribute"""
+    return ' '.join(str(v) for v in values)
+
+def _soa(rows: list[list[float]]) -> np.ndarray:
+    """Store a per-part [x, y, z] table as contiguous (3, parts) coordinate rows"""
+    return np.ascontiguousarray(np.array(rows, dtype=np.float64).T)
+
+def _place(scale: np.ndarray, pad: np.ndarray, chassis_size: list[float]) -> list[list[float]]:
+    """Chassis-relative [x, y, z] per part for a table: scale * chassis_size + pad"""
+    chassis = np.asarray(chassis_size, dtype=np.float64).reshape(1, 3)
+    return part_offsets(scale, pad, chassis)[0].T.tolist()
+
+class RobotKind(Enum):
+    """Robot models the factory can build"""
+    CAR = 'car'
+    TANK = 'tank'
+    HUMANOID = 'humanoid'
+    ROVER = 'rover'
+    CUSTOM = 'custom'
+
+def _robot_kind(model_type: str | RobotKind) -> RobotKind:
+    """Resolve a model name to its RobotKind, falling back to CAR"""
+    if isinstance(model_type, RobotKind):
+        return model_type
+    try:
+        return RobotKind(model_type.lower())
+    except ValueError:
+        print(f"❌ Unknown robot model: {model_type}")
+        print(f"Available models: {[kind.value for kind in RobotKind]}")
+        return RobotKind.CAR  # Default fallback
 
 class RobotModelFactory:
     """Factory for creating different robot models"""
     
-    def __init__(self):
-        self.robot_models = {
-            'car': self.create_car_robot,
-            'tank': self.create_tank_robot,
-            'humanoid': self.create_humanoid_robot,
-            'rover': self.create_rover_robot,
-            'custom': self.create_custom_robot
-        }
+    __slots__ = ('verbose', '_shape_cache', '_visual_specs', '_urdf_cache', '_urdf_dir',
+                 '_created_ids', '_positions')
+    
+    # Part offsets from the chassis centre as (scale, pad) tables:
+    # offset = scale * chassis_size + pad. Written one row per part, stored
+    # transposed as contiguous x/y/z rows of shape (3, parts)
+    _CAR_WHEEL_SCALE = _soa([
+        [0.7, 1.0, -0.5],    # Front right
+        [0.7, -1.0, -0.5],   # Front left
+        [-0.7, 1.0, -0.5],   # Back right
+        [-0.7, -1.0, -0.5],  # Back left
+    ])
+    _CAR_WHEEL_PAD = _soa([
+        [0.0, 0.05, 0.0],
+        [0.0, -0.05, 0.0],
+        [0.0, 0.05, 0.0],
+        [0.0, -0.05, 0.0],
+    ])
+    _CAR_SENSOR_SCALE = _soa([
+        [1.0, 0.0, 0.0],   # Front center
+        [0.8, 0.7, 0.0],   # Front right
+        [0.8, -0.7, 0.0],  # Front left
+    ])
+    _CAR_SENSOR_PAD = _soa([
+        [0.05, 0.0, 0.05],
+        [0.0, 0.0, 0.05],
+        [0.0, 0.0, 0.05],
+    ])
+    _TANK_TRACK_SCALE = _soa([
+        [0.0, -1.0, 0.0],  # Left
+        [0.0, 1.0, 0.0],   # Right
+    ])
+    _TANK_TRACK_PAD = _soa([
+        [0.0, -0.05, -0.1],
+        [0.0, 0.05, -0.1],
+    ])
+    _ROVER_WHEEL_SCALE = _soa([
+        [0.8, 1.0, -1.0],    # Front right
+        [0.8, -1.0, -1.0],   # Front left
+        [0.0, 1.0, -1.0],    # Middle right
+        [0.0, -1.0, -1.0],   # Middle left
+        [-0.8, 1.0, -1.0],   # Back right
+        [-0.8, -1.0, -1.0],  # Back left
+    ])
+    _ROVER_WHEEL_PAD = _soa([
+        [0.0, 0.1, 0.0],
+        [0.0, -0.1, 0.0],
+        [0.0, 0.1, 0.0],
+        [0.0, -0.1, 0.0],
+        [0.0, 0.1, 0.0],
+        [0.0, -0.1, 0.0],
+    ])
+    
+    def __init__(self, verbose: bool = False):
+        # Per-part progress lines are only printed when verbose
+        self.verbose = verbose
+        # (geometry, size[, rgba]) -> shape index, shared by every robot built
+        self._shape_cache: dict[tuple, int] = {}
+        # visual shape index -> primitive spec, for merging into compound shapes
+        self._visual_specs: dict[int, tuple] = {}
+        # model parameters -> generated URDF path (files outlive simulation resets)
+        self._urdf_cache: dict[tuple, str] = {}
+        # Directory holding those URDFs; removed when the factory is collected or at exit
+        self._urdf_dir: tempfile.TemporaryDirectory | None = None
+        # Every robot built so far and its last factory-set base position, row-aligned
+        self._created_ids: list[int] = []
+        self._positions = np.empty((0, 3), dtype=np.float32)
+    
+    def _log(self, message: str, *args):
+        """Print a per-part progress line when verbose; %-args are only formatted then"""
+        if self.verbose:
+            print(message % args if args else message)
+    
+    def reset_simulation(self):
+        """Reset the PyBullet world and drop the now-invalid cached shapes"""
+        p = _pb()
+        p.resetSimulation()
+        self._shape_cache.clear()
+        self._visual_specs.clear()
+        self._created_ids.clear()
+        self._positions = np.empty((0, 3), dtype=np.float32)
+    
+    def _register(self, robot_ids: list[int], positions: list[list[float]]):
+        """Remember created robots and their base positions for move_robots()"""
+        self._created_ids.extend(robot_ids)
+        self._positions = np.vstack([self._positions,
+                                     np.asarray(positions, dtype=np.float32).reshape(-1, 3)])
+    
+    def move_robots(self, deltas: np.ndarray):
+        """Shift every created robot by deltas, shape (3,) or (robots, 3)
+        
+        Poses are set kinematically from the positions this factory last
+        placed them at, with identity orientation.
+        """
+        p = _pb()
+        self._positions += np.asarray(deltas, dtype=np.float32)
+        for robot_id, position in zip(self._created_ids, self._positions.tolist()):
+            p.resetBasePositionAndOrientation(robot_id, position, (0, 0, 0, 1))
+    
+    def _cached_shape(self, key: tuple, create) -> int:
+        """Return the shape index for key, creating it on first use"""
+        index = self._shape_cache.get(key)
+        if index is None:
+            index = self._shape_cache[key] = create()
+        return index
+    
+    def _cached_visual(self, geom: int, rgba: list[float], radius: float = 0.0,
+                       half_extents: list[float] = (0.0, 0.0, 0.0), length: float = 0.0) -> int:
+        """Return the visual shape index for a primitive, creating it on first use"""
+        p = _pb()
+        spec = (geom, radius, tuple(half_extents), length, tuple(rgba))
+        index = self._shape_cache.get(spec)
+        if index is None:
+            index = self._shape_cache[spec] = p.createVisualShape(
+                geom, radius=radius, halfExtents=half_extents, length=length, rgbaColor=rgba
+            )
+            self._visual_specs[index] = spec
+        return index
     
-    def create_robot(self, model_type: str = 'car', position: List[float] = [0, 0, 0.5], **kwargs) -> int:
+    def _get_box_shape(self, half_extents: list[float], rgba: list[float],
+                       collision: bool = True) -> tuple[int, int]:
+        """Cached (collision, visual) box shapes; collision is -1 for visual-only parts"""
+        p = _pb()
+        half_extents = tuple(half_extents)
+        coll = self._cached_shape(
+            ('box', half_extents),
+            lambda: p.createCollisionShape(p.GEOM_BOX, halfExtents=half_extents)
+        ) if collision else -1
+        vis = self._cached_visual(p.GEOM_BOX, rgba, half_extents=half_extents)
+        return coll, vis
+    
+    def _get_cylinder_shape(self, radius: float, length: float, rgba: list[float],
+                            collision: bool = True) -> tuple[int, int]:
+        """Cached (collision, visual) cylinder shapes; collision is -1 for visual-only parts"""
+        p = _pb()
+        coll = self._cached_shape(
+            ('cylinder', radius, length),
+            lambda: p.createCollisionShape(p.GEOM_CYLINDER, radius=radius, height=length)
+        ) if collision else -1
+        vis = self._cached_visual(p.GEOM_CYLINDER, rgba, radius=radius, length=length)
+        return coll, vis
+    
+    def _get_sphere_shape(self, radius: float, rgba: list[float],
+                          collision: bool = True) -> tuple[int, int]:
+        """Cached (collision, visual) sphere shapes; collision is -1 for visual-only parts"""
+        p = _pb()
+        coll = self._cached_shape(
+            ('sphere', radius),
+            lambda: p.createCollisionShape(p.GEOM_SPHERE, radius=radius)
+        ) if collision else -1
+        vis = self._cached_visual(p.GEOM_SPHERE, rgba, radius=radius)
+        return coll, vis
+    
+    def create_robot(self, model_type: str | RobotKind = 'car',
+                     position: list[float] = [0, 0, 0.5], collision_lod: str = 'exact',
+                     **kwargs) -> int:
         """Create a robot of the specified type"""
-        if model_type not in self.robot_models:
-            print(f"❌ Unknown robot model: {model_type}")
-            print(f"Available models: {list(self.robot_models.keys())}")
-            model_type = 'car'  # Default fallback
-        
-        print(f"🤖 Creating {model_type.upper()} robot model...")
-        return self.robot_models[model_type](position, **kwargs)
+        kind = _robot_kind(model_type)
+        
+        print(f"🤖 Creating {kind.name} robot model...")
+        urdf = self._URDF_BUILDERS.get(kind)
+        if urdf is not None:
+            # The native URDF loader builds the whole articulated robot in one call
+            return self._load_urdf(urdf(self, collision_lod=collision_lod, **kwargs), position)
+        body = self._BODY_BUILDERS[kind](self, collision_lod=collision_lod, **kwargs)
+        return self._build_body(body, position)
+    
+    def create_robots(self, specs: list[dict]) -> list[int]:
+        """Create many robots, one batched native call per group of identical specs
+        
+        URDF-backed kinds (the car) have no batched loader; each robot in a
+        group is loaded from the group's shared URDF, the same model
+        create_robot() builds.
+        """
+        # Specs that differ only in position share shapes, parts and masses
+        groups = defaultdict(list)
+        for index, spec in enumerate(specs):
+            kwargs = dict(spec)
+            kind = _robot_kind(kwargs.pop('model_type', 'car'))
+            position = kwargs.pop('position', [0, 0, 0.5])
+            groups[(kind, repr(sorted(kwargs.items())))].append((index, position, kwargs))
+        
+        robot_ids = [-1] * len(specs)
+        for (kind, _), members in groups.items():
+            print(f"🤖 Creating {len(members)} x {kind.name} robot model...")
+            positions = [position for _, position, _ in members]
+            urdf = self._URDF_BUILDERS.get(kind)
+            if urdf is not None:
+                path = urdf(self, **members[0][2])
+                ids = [self._load_urdf(path, position) for position in positions]
+            else:
+                body = self._BODY_BUILDERS[kind](self, **members[0][2])
+                ids = self._build_body(body, positions[0], batch_positions=positions)
+            for (index, _, _), robot_id in zip(members, ids):
+                robot_ids[index] = robot_id
+        
+        return robot_ids
     
-    def create_car_robot(self, position: List[float], **kwargs) -> int:
+    def _load_urdf(self, path: str, position: list[float]) -> int:
+        """Load a generated URDF, sharing graphics shapes with earlier loads"""
+        p = _pb()
+        robot_id = p.loadURDF(path, basePosition=position,
+                              flags=p.URDF_ENABLE_CACHED_GRAPHICS_SHAPES)
+        self._register([robot_id], [position])
+        return robot_id
+    
+    def _merge_visual_parts(self, parts: list[Part]) -> list[Part]:
+        """Fold the visual-only parts into one link carrying a compound visual shape"""
+        solid = [part for part in parts if part[1] != -1]
+        decor = [part for part in parts if part[1] == -1]
+        if len(decor) < 2:
+            return parts
+        
+        # Put the merged link at the parts' centre of mass so the body's balance is unchanged
+        masses = np.array([part[0] for part in decor], dtype=float)
+        offsets = np.array([part[3] for part in decor], dtype=float)
+        total = masses.sum()
+        centre = masses @ offsets / total if total > 0 else offsets.mean(axis=0)
+        frames = (offsets - centre).tolist()
+        
+        def create():
+            p = _pb()
+            specs = [self._visual_specs[part[2]] for part in decor]
+            geoms, radii, half_extents, lengths, colors = zip(*specs)
+            return p.createVisualShapeArray(shapeTypes=list(geoms),
+                                            radii=list(radii),
+                                            halfExtents=[list(h) for h in half_extents],
+                                            lengths=list(lengths),
+                                            rgbaColors=[list(c) for c in colors],
+                                            visualFramePositions=frames)
+        
+        key = ('compound',) + tuple((part[2], tuple(frame)) for part, frame in zip(decor, frames))
+        compound = self._cached_shape(key, create)
+        return solid + [(float(total), -1, compound, centre.tolist())]
+    
+    def _build_body(self, body: Body, position: list[float],
+                    batch_positions: list[list[float]] | None = None):
+        """Create the chassis and its parts as one multi-body joined by fixed joints
+        
+        With batch_positions, one copy is created at each position and the
+        tuple of body ids is returned.
+        """
+        p = _pb()
+        base_mass, base_shape, base_visual, parts = body
+        parts = self._merge_visual_parts(parts)
+        batch = {'batchPositions': batch_positions} if batch_positions else {}
+        n = len(parts)
+        masses, shapes, visuals, offsets = (list(col) for col in zip(*parts)) if n else ([], [], [], [])
+        
+        robot_ids = p.createMultiBody(baseMass=base_mass,
+                                      baseCollisionShapeIndex=base_shape,
+                                      baseVisualShapeIndex=base_visual,
+                                      basePosition=position,
+                                      linkMasses=masses,
+                                      linkCollisionShapeIndices=shapes,
+                                      linkVisualShapeIndices=visuals,
+                                      linkPositions=offsets,
+                                      linkOrientations=[[0, 0, 0, 1]] * n,
+                                      linkInertialFramePositions=[[0, 0, 0]] * n,
+                                      linkInertialFrameOrientations=[[0, 0, 0, 1]] * n,
+                                      linkParentIndices=[0] * n,  # All attached to the chassis
+                                      linkJointTypes=[p.JOINT_FIXED] * n,
+                                      linkJointAxis=[[0, 0, 0]] * n,
+                                      **batch)
+        
+        if batch_positions:
+            # The client only caches body info for the last body of a batch
+            p.syncBodyInfo()
+            self._register(list(robot_ids), batch_positions)
+        else:
+            self._register([robot_ids], [position])
+        return robot_ids
+    
+    def create_car_robot(self, position: list[float], **kwargs) -> int:
         """Create a realistic car-like robot"""
-        # Customizable parameters
-        chassis_size = kwargs.get('chassis_size', [0.4, 0.2, 0.1])
-        chassis_color = kwargs.get('chassis_color', [0.2, 0.5, 0.8, 1.0])  # Blue
-        wheel_radius = kwargs.get('wheel_radius', 0.1)
-        wheel_width = kwargs.get('wheel_width', 0.05)
+        return self._load_urdf(self._car_urdf(**kwargs), position)
+    
+    @staticmethod
+    def _car_params(**kwargs) -> tuple:
+        """Customizable car parameters with their defaults"""
+        return (tuple(kwargs.get('chassis_size', (0.4, 0.2, 0.1))),
+                tuple(kwargs.get('chassis_color', (0.2, 0.5, 0.8, 1.0))),  # Blue
+                kwargs.get('wheel_radius', 0.1),
+                kwargs.get('wheel_width', 0.05),
+                kwargs.get('collision_lod', 'exact'))
+    
+    def _car_urdf(self, **kwargs) -> str:
+        """Path to the URDF for this car variant, generated on first use"""
+        params = self._car_params(**kwargs)
+        path = self._urdf_cache.get(params)
+        if path is not None:
+            return path
+        
+        chassis_size, chassis_color, wheel_radius, wheel_width, collision_lod = params
+        if collision_lod == 'fast':
+            wheel_collision = f'<sphere radius="{wheel_radius}"/>'
+        elif collision_lod == 'box':
+            wheel_collision = f'<box size="{_xyz((2 * wheel_radius, 2 * wheel_radius, wheel_width))}"/>'
+        else:
+            wheel_collision = f'<cylinder radius="{wheel_radius}" length="{wheel_width}"/>'
+        
+        fields = {
+            'chassis_box': _xyz(2 * half for half in chassis_size),  # URDF sizes are full extents
+            'chassis_rgba': _xyz(chassis_color),
+            'wheel_radius': wheel_radius,
+            'wheel_width': wheel_width,
+            'wheel_collision': wheel_collision,
+            'camera_xyz': _xyz((0, 0, chassis_size[2] + 0.05)),
+        }
+        for i, pos in enumerate(_place(self._CAR_WHEEL_SCALE, self._CAR_WHEEL_PAD, chassis_size)):
+            fields[f'wheel_xyz_{i}'] = _xyz(pos)
+        for i, pos in enumerate(_place(self._CAR_SENSOR_SCALE, self._CAR_SENSOR_PAD, chassis_size)):
+            fields[f'sensor_xyz_{i}'] = _xyz(pos)
+        
+        if self._urdf_dir is None:
+            self._urdf_dir = tempfile.TemporaryDirectory(prefix='sarus_urdf_')
+        path = os.path.join(self._urdf_dir.name, f'car_{len(self._urdf_cache)}.urdf')
+        with open(path, 'w') as f:
+            f.write(_read_template('car.urdf.template').format(**fields))
+        
+        self._log("   📄 Car URDF written to %s", path)
+        self._urdf_cache[params] = path
+        return path
+    
+    def _car_body(self, **kwargs) -> Body:
+        """Shapes and parts for a car robot"""
+        chassis_size, chassis_color, wheel_radius, wheel_width, collision_lod = self._car_params(**kwargs)
         
-        print("🚗 Building Car-Style Robot:")
-        print(f"   - Chassis: {chassis_size}")
-        print(f"   - Color: RGB{chassis_color[:3]}")
-        print(f"   - Wheel size: {wheel_radius}m radius")
+        if self.verbose:
+            print("🚗 Building Car-Style Robot:")
+            print(f"   - Chassis: {chassis_size}")
+            print(f"   - Color: RGB{chassis_color[:3]}")
+            print(f"   - Wheel size: {wheel_radius}m radius")
         
         # Main chassis
-        chassis_shape = p.createCollisionShape(p.GEOM_BOX, halfExtents=chassis_size)
-        chassis_visual = p.createVisualShape(p.GEOM_BOX, halfExtents=chassis_size,
-                                           rgbaColor=chassis_color)
+        chassis_shape, chassis_visual = self._get_box_shape(chassis_size, chassis_color)
         
-        robot_id = p.createMultiBody(baseMass=5.0,
-                                   baseCollisionShapeIndex=chassis_shape,
-                                   baseVisualShapeIndex=chassis_visual,
-                                   basePosition=position)
+        # Wheels, sensors and equipment
+        parts = self._add_car_wheels(wheel_radius, wheel_width, chassis_size, collision_lod)
+        parts += self._add_car_equipment(chassis_size)
         
-        # Add wheels
-        self._add_car_wheels(robot_id, wheel_radius, wheel_width, chassis_size)
-        
-        # Add sensors and equipment
-        self._add_car_equipment(robot_id, chassis_size)
-        
-        return robot_id
+        return 5.0, chassis_shape, chassis_visual, parts
     
-    def create_tank_robot(self, position: List[float], **kwargs) -> int:
+    def create_tank_robot(self, position: list[float], **kwargs) -> int:
         """Create a tank-style robot with tracks"""
+        return self._build_body(self._tank_body(**kwargs), position)
+    
+    def _tank_body(self, **kwargs) -> Body:
+        """Shapes and parts for a tank robot"""
         # Customizable parameters
-        chassis_size = kwargs.get('chassis_size', [0.5, 0.3, 0.15])
-        chassis_color = kwargs.get('chassis_color', [0.3, 0.6, 0.3, 1.0])  # Green
+        chassis_size = kwargs.get('chassis_size', (0.5, 0.3, 0.15))
+        chassis_color = kwargs.get('chassis_color', (0.3, 0.6, 0.3, 1.0))  # Green
         
-        print("🛡️ Building Tank-Style Robot:")
-        print(f"   - Heavy chassis: {chassis_size}")
-        print(f"   - Military green color")
+        if self.verbose:
+            print("🛡️ Building Tank-Style Robot:")
+            print(f"   - Heavy chassis: {chassis_size}")
+            print("   - Military green color")
         
         # Heavy chassis
-        chassis_shape = p.createCollisionShape(p.GEOM_BOX, halfExtents=chassis_size)
-        chassis_visual = p.createVisualShape(p.GEOM_BOX, halfExtents=chassis_size,
-                                           rgbaColor=chassis_color)
-        
-        robot_id = p.createMultiBody(baseMass=10.0,  # Heavier than car
-                                   baseCollisionShapeIndex=chassis_shape,
-                                   baseVisualShapeIndex=chassis_visual,
-                                   basePosition=position)
+        chassis_shape, chassis_visual = self._get_box_shape(chassis_size, chassis_color)
         
-        # Add tank tracks
-        self._add_tank_tracks(robot_id, chassis_size)
+        # Tank tracks and military equipment
+        parts = self._add_tank_tracks(chassis_size)
+        parts += self._add_tank_equipment(chassis_size)
         
-        # Add military equipment
-        self._add_tank_equipment(robot_id, chassis_size)
-        
-        return robot_id
+        return 10.0, chassis_shape, chassis_visual, parts  # Heavier than car
     
-    def create_rover_robot(self, position: List[float], **kwargs) -> int:
+    def create_rover_robot(self, position: list[float], **kwargs) -> int:
         """Create a Mars rover-style robot"""
+        return self._build_body(self._rover_body(**kwargs), position)
+    
+    def _rover_body(self, **kwargs) -> Body:
+        """Shapes and parts for a rover robot"""
         # Customizable parameters
-        chassis_size = kwargs.get('chassis_size', [0.6, 0.4, 0.12])
-        chassis_color = kwargs.get('chassis_color', [0.8, 0.8, 0.8, 1.0])  # Silver
+        chassis_size = kwargs.get('chassis_size', (0.6, 0.4, 0.12))
+        chassis_color = kwargs.get('chassis_color', (0.8, 0.8, 0.8, 1.0))  # Silver
         
-        print("🚀 Building Rover-Style Robot:")
-        print(f"   - Space-grade chassis: {chassis_size}")
-        print(f"   - Silver metallic finish")
+        if self.verbose:
+            print("🚀 Building Rover-Style Robot:")
+            print(f"   - Space-grade chassis: {chassis_size}")
+            print("   - Silver metallic finish")
         
         # Space-grade chassis
-        chassis_shape = p.createCollisionShape(p.GEOM_BOX, halfExtents=chassis_size)
-        chassis_visual = p.createVisualShape(p.GEOM_BOX, halfExtents=chassis_size,
-                                           rgbaColor=chassis_color)
+        chassis_shape, chassis_visual = self._get_box_shape(chassis_size, chassis_color)
         
-        robot_id = p.createMultiBody(baseMass=8.0,
-                                   baseCollisionShapeIndex=chassis_shape,
-                                   baseVisualShapeIndex=chassis_visual,
-                                   basePosition=position)
+        # 6-wheel suspension system and scientific equipment
+        parts = self._add_rover_wheels(chassis_size)
+        parts += self._add_rover_equipment(chassis_size)
         
-        # Add 6-wheel suspension system
-        self._add_rover_wheels(robot_id, chassis_size)
-        
-        # Add scientific equipment
-        self._add_rover_equipment(robot_id, chassis_size)
-        
-        return robot_id
+        return 8.0, chassis_shape, chassis_visual, parts
     
-    def create_humanoid_robot(self, position: List[float], **kwargs) -> int:
+    def create_humanoid_robot(self, position: list[float], **kwargs) -> int:
         """Create a humanoid robot"""
-        print("🤖 Building Humanoid Robot:")
-        print("   - Bipedal design")
-        print("   - Human-like proportions")
+        return self._build_body(self._humanoid_body(**kwargs), position)
+    
+    def _humanoid_body(self, **kwargs) -> Body:
+        """Shapes and parts for a humanoid robot"""
+        if self.verbose:
+            print("🤖 Building Humanoid Robot:")
+            print("   - Bipedal design")
+            print("   - Human-like proportions")
         
         # Torso
-        torso_size = [0.15, 0.1, 0.3]
-        torso_shape = p.createCollisionShape(p.GEOM_BOX, halfExtents=torso_size)
-        torso_visual = p.createVisualShape(p.GEOM_BOX, halfExtents=torso_size,
-                                         rgbaColor=[0.7, 0.7, 0.7, 1.0])
-        
-        robot_id = p.createMultiBody(baseMass=50.0,
-                                   baseCollisionShapeIndex=torso_shape,
-                                   baseVisualShapeIndex=torso_visual,
-                                   basePosition=position)
+        torso_size = (0.15, 0.1, 0.3)
+        torso_shape, torso_visual = self._get_box_shape(torso_size, (0.7, 0.7, 0.7, 1.0))
         
-        # Add humanoid features
-        self._add_humanoid_parts(robot_id)
+        # Humanoid features
+        parts = self._add_humanoid_parts()
         
-        return robot_id
+        return 50.0, torso_shape, torso_visual, parts
     
-    def create_custom_robot(self, position: List[float], **kwargs) -> int:
+    def create_custom_robot(self, position: list[float], **kwargs) -> int:
         """Create a custom robot based on user specifications"""
-        print("⚙️ Building Custom Robot:")
-        print("   - User-defined specifications")
+        return self._build_body(self._custom_body(**kwargs), position)
+    
+    def _custom_body(self, **kwargs) -> Body:
+        """Shapes and parts for a custom robot"""
+        if self.verbose:
+            print("⚙️ Building Custom Robot:")
+            print("   - User-defined specifications")
         
         # Get custom parameters
         parts = kwargs.get('parts', [])
         base_config = kwargs.get('base_config', {
-            'size': [0.3, 0.3, 0.1],
-            'color': [1.0, 0.5, 0.0, 1.0],  # Orange
+            'size': (0.3, 0.3, 0.1),
+            'color': (1.0, 0.5, 0.0, 1.0),  # Orange
             'mass': 5.0
         })
         
         # Create base
         base_size = base_config['size']
-        base_shape = p.createCollisionShape(p.GEOM_BOX, halfExtents=base_size)
-        base_visual = p.createVisualShape(p.GEOM_BOX, halfExtents=base_size,
-                                        rgbaColor=base_config['color'])
-        
-        robot_id = p.createMultiBody(baseMass=base_config['mass'],
-                                   baseCollisionShapeIndex=base_shape,
-                                   baseVisualShapeIndex=base_visual,
-                                   basePosition=position)
+        base_shape, base_visual = self._get_box_shape(base_size, base_config['color'])
         
-        # Add custom parts
-        for part in parts:
-            self._add_custom_part(robot_id, part)
+        # Custom parts
+        links = [self._add_custom_part(part) for part in parts]
         
-        return robot_id
+        return base_config['mass'], base_shape, base_visual, links
     
-    def _add_car_wheels(self, robot_id: int, radius: float, width: float, chassis_size: List[float]):
-        """Add wheels to car robot"""
-        wheel_positions = [
-            [chassis_size[0] * 0.7, chassis_size[1] + 0.05, -chassis_size[2] * 0.5],  # Front right
-            [chassis_size[0] * 0.7, -(chassis_size[1] + 0.05), -chassis_size[2] * 0.5],  # Front left
-            [-chassis_size[0] * 0.7, chassis_size[1] + 0.05, -chassis_size[2] * 0.5],  # Back right
-            [-chassis_size[0] * 0.7, -(chassis_size[1] + 0.05), -chassis_size[2] * 0.5]  # Back left
-        ]
-        
-        robot_pos = p.getBasePositionAndOrientation(robot_id)[0]
-        
-        for i, (x, y, z) in enumerate(wheel_positions):
-            # Create wheel
-            wheel_shape = p.createCollisionShape(p.GEOM_CYLINDER, radius=radius, height=width)
-            wheel_visual = p.createVisualShape(p.GEOM_CYLINDER, radius=radius, length=width,
-                                             rgbaColor=[0.1, 0.1, 0.1, 1.0])
-            
-            wheel_pos = [robot_pos[0] + x, robot_pos[1] + y, robot_pos[2] + z]
-            
-            wheel_id = p.createMultiBody(baseMass=1.0,
-                                       baseCollisionShapeIndex=wheel_shape,
-                                       baseVisualShapeIndex=wheel_visual,
-                                       basePosition=wheel_pos)
-            
-            print(f"   ✅ Wheel {i+1} added at {wheel_pos}")
-    
-    def _add_car_equipment(self, robot_id: int, chassis_size: List[float]):
-        """Add sensors and equipment to car robot"""
-        robot_pos = p.getBasePositionAndOrientation(robot_id)[0]
-        
+    def _wheel_collider(self, radius: float, width: float, collision_lod: str) -> int:
+        """Cached wheel collision shape at the requested level of detail"""
+        p = _pb()
+        if collision_lod == 'fast':
+            return self._cached_shape(
+                ('sphere', radius),
+                lambda: p.createCollisionShape(p.GEOM_SPHERE, radius=radius)
+            )
+        if collision_lod == 'box':
+            half_extents = (radius, radius, width / 2)  # Cylinder axis is local z
+            return self._cached_shape(
+                ('box', half_extents),
+                lambda: p.createCollisionShape(p.GEOM_BOX, halfExtents=half_extents)
+            )
+        return self._cached_shape(
+            ('cylinder', radius, width),
+            lambda: p.createCollisionShape(p.GEOM_CYLINDER, radius=radius, height=width)
+        )
+    
+    def _add_car_wheels(self, radius: float, width: float, chassis_size: list[float],
+                        collision_lod: str = 'exact') -> list[Part]:
+        """Wheel links for car robot"""
+        # All four wheels share one collision and one visual shape
+        wheel_shape = self._wheel_collider(radius, width, collision_lod)
+        _, wheel_visual = self._get_cylinder_shape(radius, width, (0.1, 0.1, 0.1, 1.0),
+                                                   collision=False)
+        wheel_pos = _place(self._CAR_WHEEL_SCALE, self._CAR_WHEEL_PAD, chassis_size)
+        
+        self._log("   ✅ %d wheels added", len(wheel_pos))
+        return [(1.0, wheel_shape, wheel_visual, pos) for pos in wheel_pos]
+    
+    def _add_car_equipment(self, chassis_size: list[float]) -> list[Part]:
+        """Sensor and equipment links for car robot"""
         # Front sensors
-        sensor_positions = [
-            [chassis_size[0] + 0.05, 0, 0.05],  # Front center
-            [chassis_size[0] * 0.8, chassis_size[1] * 0.7, 0.05],  # Front right
-            [chassis_size[0] * 0.8, -chassis_size[1] * 0.7, 0.05]  # Front left
-        ]
-        
-        for i, (x, y, z) in enumerate(sensor_positions):
-            sensor_shape = p.createVisualShape(p.GEOM_CYLINDER, radius=0.02, length=0.04,
-                                             rgbaColor=[1, 1, 0, 1.0])  # Yellow
-            sensor_pos = [robot_pos[0] + x, robot_pos[1] + y, robot_pos[2] + z]
-            
-            sensor_id = p.createMultiBody(baseMass=0.1,
-                                        baseVisualShapeIndex=sensor_shape,
-                                        basePosition=sensor_pos)
-            
-            print(f"   📡 Sensor {i+1} added")
+        _, sensor_shape = self._get_cylinder_shape(0.02, 0.04, (1, 1, 0, 1.0),  # Yellow
+                                                   collision=False)
+        sensor_pos = _place(self._CAR_SENSOR_SCALE, self._CAR_SENSOR_PAD, chassis_size)
+        parts = [(0.0, -1, sensor_shape, pos) for pos in sensor_pos]
         
-        # Camera on top
-        camera_shape = p.createVisualShape(p.GEOM_BOX, halfExtents=[0.03, 0.03, 0.02],
-                                         rgbaColor=[0.1, 0.1, 0.1, 1.0])
-        camera_pos = [robot_pos[0], robot_pos[1], robot_pos[2] + chassis_size[2] + 0.05]
+        self._log("   📡 %d sensors added", len(sensor_pos))
         
-        camera_id = p.createMultiBody(baseMass=0.1,
-                                    baseVisualShapeIndex=camera_shape,
-                                    basePosition=camera_pos)
+        # Camera on top
+        _, camera_shape = self._get_box_shape((0.03, 0.03, 0.02), (0.1, 0.1, 0.1, 1.0),
+                                              collision=False)
+        parts.append((0.0, -1, camera_shape, [0, 0, chassis_size[2] + 0.05]))
         
-        print("   📷 Camera module added")
+        self._log("   📷 Camera module added")
+        return parts
     
-    def _add_tank_tracks(self, robot_id: int, chassis_size: List[float]):
-        """Add tank tracks"""
-        robot_pos = p.getBasePositionAndOrientation(robot_id)[0]
-        
-        # Left track
-        left_track_shape = p.createVisualShape(p.GEOM_BOX, 
-                                             halfExtents=[chassis_size[0], 0.05, 0.1],
-                                             rgbaColor=[0.2, 0.2, 0.2, 1.0])
-        left_track_pos = [robot_pos[0], robot_pos[1] - chassis_size[1] - 0.05, robot_pos[2] - 0.1]
-        
-        left_track_id = p.createMultiBody(baseMass=2.0,
-                                        baseVisualShapeIndex=left_track_shape,
-                                        basePosition=left_track_pos)
-        
-        # Right track
-        right_track_pos = [robot_pos[0], robot_pos[1] + chassis_size[1] + 0.05, robot_pos[2] - 0.1]
-        right_track_id = p.createMultiBody(baseMass=2.0,
-                                         baseVisualShapeIndex=left_track_shape,
-                                         basePosition=right_track_pos)
-        
-        print("   🚂 Tank tracks added")
+    def _add_tank_tracks(self, chassis_size: list[float]) -> list[Part]:
+        """Track links for tank robot"""
+        # Both tracks share one visual shape
+        _, track_shape = self._get_box_shape([chassis_size[0], 0.05, 0.1],
+                                             (0.2, 0.2, 0.2, 1.0), collision=False)
+        track_pos = _place(self._TANK_TRACK_SCALE, self._TANK_TRACK_PAD, chassis_size)
+        
+        self._log("   🚂 Tank tracks added")
+        return [(0.0, -1, track_shape, pos) for pos in track_pos]
     
-    def _add_tank_equipment(self, robot_id: int, chassis_size: List[float]):
-        """Add military-style equipment"""
-        robot_pos = p.getBasePositionAndOrientation(robot_id)[0]
-        
+    def _add_tank_equipment(self, chassis_size: list[float]) -> list[Part]:
+        """Military-style equipment links"""
         # Turret
-        turret_shape = p.createVisualShape(p.GEOM_CYLINDER, radius=0.15, length=0.1,
-                                         rgbaColor=[0.4, 0.4, 0.4, 1.0])
-        turret_pos = [robot_pos[0], robot_pos[1], robot_pos[2] + chassis_size[2] + 0.1]
-        
-        turret_id = p.createMultiBody(baseMass=1.0,
-                                    baseVisualShapeIndex=turret_shape,
-                                    basePosition=turret_pos)
+        _, turret_shape = self._get_cylinder_shape(0.15, 0.1, (0.4, 0.4, 0.4, 1.0),
+                                                   collision=False)
         
-        print("   🛡️ Turret added")
+        self._log("   🛡️ Turret added")
+        return [(0.0, -1, turret_shape, [0, 0, chassis_size[2] + 0.1])]
     
-    def _add_rover_wheels(self, robot_id: int, chassis_size: List[float]):
-        """Add 6-wheel rover suspension"""
-        robot_pos = p.getBasePositionAndOrientation(robot_id)[0]
-        
+    def _add_rover_wheels(self, chassis_size: list[float]) -> list[Part]:
+        """6-wheel rover suspension links"""
         # 6 wheels for rover
-        wheel_positions = [
-            [chassis_size[0] * 0.8, chassis_size[1] + 0.1, -chassis_size[2]],    # Front right
-            [chassis_size[0] * 0.8, -(chassis_size[1] + 0.1), -chassis_size[2]], # Front left
-            [0, chassis_size[1] + 0.1, -chassis_size[2]],                       # Middle right
-            [0, -(chassis_size[1] + 0.1), -chassis_size[2]],                    # Middle left
-            [-chassis_size[0] * 0.8, chassis_size[1] + 0.1, -chassis_size[2]],  # Back right
-            [-chassis_size[0] * 0.8, -(chassis_size[1] + 0.1), -chassis_size[2]] # Back left
-        ]
-        
-        for i, (x, y, z) in enumerate(wheel_positions):
-            wheel_shape = p.createVisualShape(p.GEOM_CYLINDER, radius=0.12, length=0.06,
-                                            rgbaColor=[0.3, 0.3, 0.3, 1.0])
-            wheel_pos = [robot_pos[0] + x, robot_pos[1] + y, robot_pos[2] + z]
-            
-            wheel_id = p.createMultiBody(baseMass=1.5,
-                                       baseVisualShapeIndex=wheel_shape,
-                                       basePosition=wheel_pos)
-        
-        print("   🚀 6-wheel suspension system added")
-    
-    def _add_rover_equipment(self, robot_id: int, chassis_size: List[float]):
-        """Add scientific equipment to rover"""
-        robot_pos = p.getBasePositionAndOrientation(robot_id)[0]
+        _, wheel_shape = self._get_cylinder_shape(0.12, 0.06, (0.3, 0.3, 0.3, 1.0),
+                                                  collision=False)
+        wheel_pos = _place(self._ROVER_WHEEL_SCALE, self._ROVER_WHEEL_PAD, chassis_size)
         
+        self._log("   🚀 6-wheel suspension system added")
+        return [(0.0, -1, wheel_shape, pos) for pos in wheel_pos]
+    
+    def _add_rover_equipment(self, chassis_size: list[float]) -> list[Part]:
+        """Scientific equipment links for rover"""
         # Mast with cameras
-        mast_shape = p.createVisualShape(p.GEOM_BOX, halfExtents=[0.02, 0.02, 0.3],
-                                       rgbaColor=[0.9, 0.9, 0.9, 1.0])
-        mast_pos = [robot_pos[0] + chassis_size[0] * 0.3, robot_pos[1], 
-                   robot_pos[2] + chassis_size[2] + 0.3]
-        
-        mast_id = p.createMultiBody(baseMass=0.5,
-                                  baseVisualShapeIndex=mast_shape,
-                                  basePosition=mast_pos)
+        _, mast_shape = self._get_box_shape((0.02, 0.02, 0.3), (0.9, 0.9, 0.9, 1.0),
+                                            collision=False)
+        mast_pos = [chassis_size[0] * 0.3, 0, chassis_size[2] + 0.3]
         
         # Solar panels
-        panel_shape = p.createVisualShape(p.GEOM_BOX, halfExtents=[0.4, 0.3, 0.01],
-                                        rgbaColor=[0.1, 0.1, 0.8, 1.0])  # Blue panels
-        panel_pos = [robot_pos[0], robot_pos[1], robot_pos[2] + chassis_size[2] + 0.15]
-        
-        panel_id = p.createMultiBody(baseMass=0.3,
-                                   baseVisualShapeIndex=panel_shape,
-                                   basePosition=panel_pos)
+        _, panel_shape = self._get_box_shape((0.4, 0.3, 0.01), (0.1, 0.1, 0.8, 1.0),  # Blue panels
+                                             collision=False)
+        panel_pos = [0, 0, chassis_size[2] + 0.15]
         
-        print("   🔬 Scientific equipment added")
-        print("   ☀️ Solar panels installed")
+        self._log("   🔬 Scientific equipment added")
+        self._log("   ☀️ Solar panels installed")
+        return [(0.0, -1, mast_shape, mast_pos), (0.0, -1, panel_shape, panel_pos)]
     
-    def _add_humanoid_parts(self, robot_id: int):
-        """Add humanoid body parts"""
-        robot_pos = p.getBasePositionAndOrientation(robot_id)[0]
-        
+    def _add_humanoid_parts(self) -> list[Part]:
+        """Humanoid body part links"""
         # Head
-        head_shape = p.createVisualShape(p.GEOM_SPHERE, radius=0.1,
-                                       rgbaColor=[0.8, 0.7, 0.6, 1.0])  # Skin tone
-        head_pos = [robot_pos[0], robot_pos[1], robot_pos[2] + 0.4]
-        
-        head_id = p.createMultiBody(baseMass=2.0,
-                                  baseVisualShapeIndex=head_shape,
-                                  basePosition=head_pos)
+        _, head_shape = self._get_sphere_shape(0.1, (0.8, 0.7, 0.6, 1.0),  # Skin tone
+                                               collision=False)
         
-        print("   🤖 Humanoid features added")
+        self._log("   🤖 Humanoid features added")
+        return [(0.0, -1, head_shape, [0, 0, 0.4])]
     
-    def _add_custom_part(self, robot_id: int, part_config: Dict):
-        """Add a custom part based on configuration"""
+    def _add_custom_part(self, part_config: dict) -> Part:
+        """Link for a custom part based on configuration"""
         part_type = part_config.get('type', 'box')
-        size = part_config.get('size', [0.1, 0.1, 0.1])
-        color = part_config.get('color', [0.5, 0.5, 0.5, 1.0])
+        size = part_config.get('size', (0.1, 0.1, 0.1))
+        color = part_config.get('color', (0.5, 0.5, 0.5, 1.0))
         position = part_config.get('position', [0, 0, 0.2])
         
-        robot_pos = p.getBasePositionAndOrientation(robot_id)[0]
-        
-        if part_type == 'box':
-            shape = p.createVisualShape(p.GEOM_BOX, halfExtents=size, rgbaColor=color)
-        elif part_type == 'cylinder':
-            shape = p.createVisualShape(p.GEOM_CYLINDER, radius=size[0], length=size[1], rgbaColor=color)
-        elif part_type == 'sphere':
-            shape = p.createVisualShape(p.GEOM_SPHERE, radius=size[0], rgbaColor=color)
-        else:
-            shape = p.createVisualShape(p.GEOM_BOX, halfExtents=size, rgbaColor=color)
-        
-        part_pos = [robot_pos[0] + position[0], robot_pos[1] + position[1], robot_pos[2] + position[2]]
+        # Unknown part types fall back to a box
+        builder = self._PART_BUILDERS.get(part_type, self._PART_BUILDERS['box'])
+        shape = builder(self, size, color)
         
-        part_id = p.createMultiBody(baseMass=0.1,
-                                  baseVisualShapeIndex=shape,
-                                  basePosition=part_pos)
-        
-        print(f"   ⚙️ Custom {part_type} part added")
-
-def get_robot_presets():
-    """Get predefined robot configurations"""
-    return {
-        'compact_car': {
-            'model_type': 'car',
-            'chassis_size': [0.3, 0.15, 0.08],
-            'chassis_color': [1.0, 0.2, 0.2, 1.0],  # Red
-            'wheel_radius': 0.08
-        },
-        'heavy_truck': {
-            'model_type': 'car', 
-            'chassis_size': [0.6, 0.25, 0.15],
-            'chassis_color': [0.1, 0.1, 0.1, 1.0],  # Black
-            'wheel_radius': 0.15
-        },
-        'military_tank': {
-            'model_type': 'tank',
-            'chassis_size': [0.7, 0.4, 0.2],
-            'chassis_color': [0.2, 0.4, 0.2, 1.0]  # Dark green
-        },
-        'mars_rover': {
-            'model_type': 'rover',
-            'chassis_size': [0.8, 0.5, 0.15],
-            'chassis_color': [0.9, 0.9, 0.9, 1.0]  # Silver
-        },
-        'racing_car': {
-            'model_type': 'car',
-            'chassis_size': [0.5, 0.18, 0.06],
-            'chassis_color': [1.0, 0.8, 0.0, 1.0],  # Gold
-            'wheel_radius': 0.12
-        }
+        self._log("   ⚙️ Custom %s part added", part_type)
+        return (0.0, -1, shape, list(position))
+    
+    # Custom part type -> cached visual shape from (factory, size, color)
+    _PART_BUILDERS = {
+        'box': lambda self, size, color: self._get_box_shape(size, color, collision=False)[1],
+        'cylinder': lambda self, size, color: self._get_cylinder_shape(size[0], size[1], color,
+                                                                       collision=False)[1],
+        'sphere': lambda self, size, color: self._get_sphere_shape(size[0], color, collision=False)[1]
+    }
+    
+    # Body description builder per model, resolved once at class creation
+    _BODY_BUILDERS = {
+        RobotKind.CAR: _car_body,
+        RobotKind.TANK: _tank_body,
+        RobotKind.HUMANOID: _humanoid_body,
+        RobotKind.ROVER: _rover_body,
+        RobotKind.CUSTOM: _custom_body
+    }
+    
+    # Models with a URDF template; create_robot loads these natively
+    _URDF_BUILDERS = {
+        RobotKind.CAR: _car_urdf
     }
 
+# Predefined robot configurations, built once and shared read-only
+_ROBOT_PRESETS = MappingProxyType({
+    'compact_car': MappingProxyType({
+        'model_type': 'car',
+        'chassis_size': (0.3, 0.15, 0.08),
+        'chassis_color': (1.0, 0.2, 0.2, 1.0),  # Red
+        'wheel_radius': 0.08
+    }),
+    'heavy_truck': MappingProxyType({
+        'model_type': 'car', 
+        'chassis_size': (0.6, 0.25, 0.15),
+        'chassis_color': (0.1, 0.1, 0.1, 1.0),  # Black
+        'wheel_radius': 0.15
+    }),
+    'military_tank': MappingProxyType({
+        'model_type': 'tank',
+        'chassis_size': (0.7, 0.4, 0.2),
+        'chassis_color': (0.2, 0.4, 0.2, 1.0)  # Dark green
+    }),
+    'mars_rover': MappingProxyType({
+        'model_type': 'rover',
+        'chassis_size': (0.8, 0.5, 0.15),
+        'chassis_color': (0.9, 0.9, 0.9, 1.0)  # Silver
+    }),
+    'racing_car': MappingProxyType({
+        'model_type': 'car',
+        'chassis_size': (0.5, 0.18, 0.06),
+        'chassis_color': (1.0, 0.8, 0.0, 1.0),  # Gold
+        'wheel_radius': 0.12
+    })
+})
+
+def get_robot_presets() -> MappingProxyType:
+    """Get predefined robot configurations (read-only; copy with dict() to modify)"""
+    return _ROBOT_PRESETS
+
 if __name__ == "__main__":
     print("🤖 Custom Robot Models Module")
     print("Available robot types:")
-    factory = RobotModelFactory()
-    for model_type in factory.robot_models.keys():
-        print(f"  - {model_type}")
+    for kind in RobotKind:
+        print(f"  - {kind.value}")
     
     print("\nAvailable presets:")
     presets = get_robot_presets()
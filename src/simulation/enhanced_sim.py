@@ -5,15 +5,38 @@ Advanced 3D Physics Simulation with Multiple Camera Angles
 Interactive Controls and Enhanced Visual Experience
 """
 import pybullet as p
+import pybullet_data
 import numpy as np
 import time
-import math
 import os
 from typing import Dict, List, Tuple, Optional
 
+from ..utils.scheduling import FixedRateTimer
+from ._robot_math import heading_vector
+
+# Control slider names, in the order of the index constants below
+CONTROL_NAMES = ('forward', 'backward', 'left', 'right', 'stop', 'speed',
+                 'camera_mode', 'camera_distance', 'auto_demo', 'reset_position',
+                 'pause_sim', 'step_sim', 'run_again')
+(FORWARD, BACKWARD, LEFT, RIGHT, STOP, SPEED,
+ CAMERA_MODE, CAMERA_DISTANCE, AUTO_DEMO, RESET_POSITION,
+ PAUSE_SIM, STEP_SIM, RUN_AGAIN) = range(len(CONTROL_NAMES))
+
+# Slider starting values, used until a slider is read
+CONTROL_DEFAULTS = (0, 0, 0, 0, 0, 0.5, 0, 3.0, 0, 0, 0, 0, 0)
+
+# Obstacle sensor indices, in the order of _sensor_names
+FRONT_LEFT, FRONT_CENTER, FRONT_RIGHT, LEFT_SIDE, RIGHT_SIDE = range(5)
+
 class EnhancedSarusSimulation:
     """Enhanced 3D robot simulation with professional features"""
     
+    FRAME_PERIOD = 1./60.  # Render and control rate
+    PHYSICS_STEPS_PER_FRAME = 4  # 240 Hz physics, matching setTimeStep
+    DRIVE_CONTROLS = (FORWARD, BACKWARD, LEFT, RIGHT, STOP, SPEED)
+    CONTROL_POLL_FRAMES = 6  # Camera, demo and sim toggles are read at 10 Hz
+    ROBOT_COLLISION_GROUP = 0x40  # Clear of Bullet's built-in default/static/kinematic filter bits
+    
     def __init__(self, gui_mode=True):
         self.physics_client = None
         self.robot_id = None
@@ -23,12 +46,26 @@ class EnhancedSarusSimulation:
         self.camera_mode = 0  # 0=follow, 1=top, 2=side, 3=free
         self.camera_distance = 3.0
         self.robot_position = [0, 0, 0]
+        self._robot_pose = None  # (position, orientation), read at most once per step
+        self._shape_cache: Dict[Tuple, Tuple[int, int]] = {}  # (half_extents, rgba) -> (visual, collision)
         self.control_buttons = {}
+        self._control_ids = (-1,) * len(CONTROL_NAMES)  # Slider id per CONTROL_NAMES index, -1 if absent
+        
+        # Obstacle sensor ray offsets in the robot base frame
+        self._sensor_names = ('front_left', 'front_center', 'front_right', 'left', 'right')
+        self._sensor_offsets = np.array([
+            [0.3, 0.15, 0.1],
+            [0.3, 0, 0.1],
+            [0.3, -0.15, 0.1],
+            [0, 0.2, 0.1],
+            [0, -0.2, 0.1]
+        ])
+        self._obstacle_flags = [False] * len(self._sensor_names)  # Refilled in place each check
         
         # Enhanced visual settings
         self.visual_config = {
             'shadows': True,
-            'reflections': True,
+            'reflections': False,
             'ambient_light': [0.4, 0.4, 0.4],
             'direct_light': [0.8, 0.8, 0.8],
             'background_color': [0.2, 0.3, 0.4]
@@ -51,6 +88,12 @@ class EnhancedSarusSimulation:
             # Set background color
             p.configureDebugVisualizer(p.COV_ENABLE_RGB_BUFFER_PREVIEW, 0)
             
+            # No camera images are rendered, so skip the preview panes and software renderer
+            p.configureDebugVisualizer(p.COV_ENABLE_DEPTH_BUFFER_PREVIEW, 0)
+            p.configureDebugVisualizer(p.COV_ENABLE_SEGMENTATION_MARK_PREVIEW, 0)
+            p.configureDebugVisualizer(p.COV_ENABLE_TINY_RENDERER, 0)
+            p.configureDebugVisualizer(p.COV_ENABLE_PLANAR_REFLECTION, 0)
+            
         else:
             self.physics_client = p.connect(p.DIRECT)
         
@@ -58,15 +101,34 @@ class EnhancedSarusSimulation:
         p.setGravity(0, 0, -9.81)
         p.setTimeStep(1./240.)
         
+        # One mobile robot among static boxes needs few solver iterations
+        p.setPhysicsEngineParameter(
+            numSolverIterations=4,
+            minimumSolverIslandSize=1024,
+            contactBreakingThreshold=0.04,
+            deterministicOverlappingPairs=0,
+            solverResidualThreshold=1e-3,  # Stop iterating early once converged
+            enableSAT=0,
+            allowedCcdPenetration=0.0,
+            warmStartingFactor=0.85,  # Seed contacts from last step's impulses
+            useSplitImpulse=1,
+            splitImpulsePenetrationThreshold=-0.02
+        )
+        
         # Enhanced lighting
         self._setup_enhanced_lighting()
         
+        # Build the scene without incremental GUI redraws
+        p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 0)
+        
         # Create realistic environment
         self._create_enhanced_environment()
         
         # Create enhanced robot model
         self._create_enhanced_robot()
         
+        p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 1)
+        
         # Add interactive controls
         if self.gui_mode:
             self._setup_interactive_controls()
@@ -97,25 +159,15 @@ class EnhancedSarusSimulation:
         """Create a realistic college laboratory environment"""
         print("🏗️ Building enhanced laboratory environment...")
         
-        # Enhanced floor with grid pattern
-        floor_visual = p.createVisualShape(
-            p.GEOM_BOX,
-            halfExtents=[10, 10, 0.05],
+        # Enhanced floor: an infinite plane is cheaper than a box in broadphase and narrowphase
+        p.setAdditionalSearchPath(pybullet_data.getDataPath())
+        floor_id = p.loadURDF("plane100.urdf", useMaximalCoordinates=True)
+        p.changeVisualShape(
+            floor_id,
+            -1,
             rgbaColor=[0.8, 0.8, 0.9, 1.0],
             specularColor=[0.1, 0.1, 0.1]
         )
-        
-        floor_collision = p.createCollisionShape(
-            p.GEOM_BOX,
-            halfExtents=[10, 10, 0.05]
-        )
-        
-        floor_id = p.createMultiBody(
-            baseMass=0,
-            baseCollisionShapeIndex=floor_collision,
-            baseVisualShapeIndex=floor_visual,
-            basePosition=[0, 0, -0.05]
-        )
         self.lab_objects['floor'] = floor_id
         
         # Create realistic lab equipment
@@ -123,6 +175,50 @@ class EnhancedSarusSimulation:
         self._create_lab_equipment()
         self._create_walls_and_barriers()
         
+    def _get_box_shape(self, half_extents: Tuple[float, ...], rgba: Tuple[float, ...]) -> Tuple[int, int]:
+        """Visual and collision GEOM_BOX shapes, created once per size and colour"""
+        key = (tuple(half_extents), tuple(rgba))
+        if key not in self._shape_cache:
+            box_visual = p.createVisualShape(
+                p.GEOM_BOX,
+                halfExtents=half_extents,
+                rgbaColor=rgba
+            )
+            
+            box_collision = p.createCollisionShape(
+                p.GEOM_BOX,
+                halfExtents=half_extents
+            )
+            
+            self._shape_cache[key] = (box_visual, box_collision)
+        return self._shape_cache[key]
+    
+    def _create_boxes(self, boxes: List[Tuple[str, List[float], List[float], List[float]]],
+                      mass: float = 0) -> None:
+        """Create (name, half_extents, rgba, position) boxes, one batched call per unique shape"""
+        groups: Dict[Tuple, Tuple[List[str], List[List[float]]]] = {}
+        for name, half_extents, rgba, position in boxes:
+            names, positions = groups.setdefault((tuple(half_extents), tuple(rgba)), ([], []))
+            names.append(name)
+            positions.append(position)
+        
+        for (half_extents, rgba), (names, positions) in groups.items():
+            box_visual, box_collision = self._get_box_shape(half_extents, rgba)
+            
+            # batchPositions creates every body sharing these shapes in one round-trip
+            box_ids = p.createMultiBody(
+                baseMass=mass,
+                baseCollisionShapeIndex=box_collision,
+                baseVisualShapeIndex=box_visual,
+                batchPositions=positions,
+                useMaximalCoordinates=True  # Unarticulated boxes, no Featherstone needed
+            )
+            
+            self.lab_objects.update(zip(names, box_ids))
+        
+        # The client only caches body info for the last body of each batch
+        p.syncBodyInfo()
+    
     def _create_lab_tables(self):
         """Create realistic laboratory tables"""
         table_configs = [
@@ -132,27 +228,11 @@ class EnhancedSarusSimulation:
             {'pos': [-2, -3, 0], 'size': [1.0, 1.5, 0.8], 'color': [0.7, 0.3, 0.3, 1.0]}
         ]
         
+        boxes = []
         for i, config in enumerate(table_configs):
             # Table top
-            table_visual = p.createVisualShape(
-                p.GEOM_BOX,
-                halfExtents=config['size'],
-                rgbaColor=config['color']
-            )
-            
-            table_collision = p.createCollisionShape(
-                p.GEOM_BOX,
-                halfExtents=config['size']
-            )
-            
-            table_id = p.createMultiBody(
-                baseMass=0,
-                baseCollisionShapeIndex=table_collision,
-                baseVisualShapeIndex=table_visual,
-                basePosition=[config['pos'][0], config['pos'][1], config['size'][2]]
-            )
-            
-            self.lab_objects[f'table_{i}'] = table_id
+            boxes.append((f'table_{i}', config['size'], config['color'],
+                          [config['pos'][0], config['pos'][1], config['size'][2]]))
             
             # Table legs
             leg_size = [0.05, 0.05, config['size'][2]]
@@ -164,25 +244,10 @@ class EnhancedSarusSimulation:
             ]
             
             for j, leg_pos in enumerate(leg_positions):
-                leg_visual = p.createVisualShape(
-                    p.GEOM_BOX,
-                    halfExtents=leg_size,
-                    rgbaColor=[0.3, 0.2, 0.1, 1.0]
-                )
-                
-                leg_collision = p.createCollisionShape(
-                    p.GEOM_BOX,
-                    halfExtents=leg_size
-                )
-                
-                leg_id = p.createMultiBody(
-                    baseMass=0,
-                    baseCollisionShapeIndex=leg_collision,
-                    baseVisualShapeIndex=leg_visual,
-                    basePosition=[leg_pos[0], leg_pos[1], leg_size[2]]
-                )
-                
-                self.lab_objects[f'table_{i}_leg_{j}'] = leg_id
+                boxes.append((f'table_{i}_leg_{j}', leg_size, [0.3, 0.2, 0.1, 1.0],
+                              [leg_pos[0], leg_pos[1], leg_size[2]]))
+        
+        self._create_boxes(boxes)
     
     def _create_lab_equipment(self):
         """Create realistic laboratory equipment"""
@@ -200,26 +265,8 @@ class EnhancedSarusSimulation:
             {'pos': [-1.8, -2.8, 1.6], 'size': [0.2, 0.2, 0.25], 'color': [0.9, 0.8, 0.7, 1.0], 'type': 'instrument'}
         ]
         
-        for i, config in enumerate(equipment_configs):
-            equipment_visual = p.createVisualShape(
-                p.GEOM_BOX,
-                halfExtents=config['size'],
-                rgbaColor=config['color']
-            )
-            
-            equipment_collision = p.createCollisionShape(
-                p.GEOM_BOX,
-                halfExtents=config['size']
-            )
-            
-            equipment_id = p.createMultiBody(
-                baseMass=0.1,
-                baseCollisionShapeIndex=equipment_collision,
-                baseVisualShapeIndex=equipment_visual,
-                basePosition=config['pos']
-            )
-            
-            self.lab_objects[f"{config['type']}_{i}"] = equipment_id
+        self._create_boxes([(f"{config['type']}_{i}", config['size'], config['color'], config['pos'])
+                            for i, config in enumerate(equipment_configs)], mass=0.1)
     
     def _create_walls_and_barriers(self):
         """Create walls and safety barriers"""
@@ -231,26 +278,8 @@ class EnhancedSarusSimulation:
             {'pos': [-6, 0, 1.5], 'size': [0.1, 6, 1.5], 'color': [0.9, 0.9, 0.85, 1.0]}  # West wall
         ]
         
-        for i, config in enumerate(wall_configs):
-            wall_visual = p.createVisualShape(
-                p.GEOM_BOX,
-                halfExtents=config['size'],
-                rgbaColor=config['color']
-            )
-            
-            wall_collision = p.createCollisionShape(
-                p.GEOM_BOX,
-                halfExtents=config['size']
-            )
-            
-            wall_id = p.createMultiBody(
-                baseMass=0,
-                baseCollisionShapeIndex=wall_collision,
-                baseVisualShapeIndex=wall_visual,
-                basePosition=config['pos']
-            )
-            
-            self.lab_objects[f'wall_{i}'] = wall_id
+        self._create_boxes([(f'wall_{i}', config['size'], config['color'], config['pos'])
+                            for i, config in enumerate(wall_configs)])
     
     def _create_enhanced_robot(self):
         """Create a realistic robot car model"""
@@ -283,6 +312,12 @@ class EnhancedSarusSimulation:
         # Add sensors and details
         self._add_robot_details()
         
+        # The robot parts are separate overlapping bodies: never pair-test them against each other
+        robot_parts = [self.robot_id, self.lab_objects['robot_sensor']]
+        robot_parts += [self.lab_objects[f'wheel_{i}'] for i in range(4)]
+        for body_id in robot_parts:
+            p.setCollisionFilterGroupMask(body_id, -1, self.ROBOT_COLLISION_GROUP, ~self.ROBOT_COLLISION_GROUP)
+        
     def _add_robot_wheels(self):
         """Add realistic wheels to the robot"""
         wheel_radius = 0.05
@@ -295,20 +330,21 @@ class EnhancedSarusSimulation:
             [-0.2, -0.18, 0.05]  # Rear left
         ]
         
+        # All four wheels share one shape pair
+        wheel_visual = p.createVisualShape(
+            p.GEOM_CYLINDER,
+            radius=wheel_radius,
+            length=wheel_width,
+            rgbaColor=[0.1, 0.1, 0.1, 1.0]
+        )
+        
+        wheel_collision = p.createCollisionShape(
+            p.GEOM_CYLINDER,
+            radius=wheel_radius,
+            height=wheel_width
+        )
+        
         for i, pos in enumerate(wheel_positions):
-            wheel_visual = p.createVisualShape(
-                p.GEOM_CYLINDER,
-                radius=wheel_radius,
-                length=wheel_width,
-                rgbaColor=[0.1, 0.1, 0.1, 1.0]
-            )
-            
-            wheel_collision = p.createCollisionShape(
-                p.GEOM_CYLINDER,
-                radius=wheel_radius,
-                height=wheel_width
-            )
-            
             wheel_id = p.createMultiBody(
                 baseMass=0.2,
                 baseCollisionShapeIndex=wheel_collision,
@@ -321,16 +357,7 @@ class EnhancedSarusSimulation:
     def _add_robot_details(self):
         """Add sensors and visual details to the robot"""
         # Camera/sensor on top
-        sensor_visual = p.createVisualShape(
-            p.GEOM_BOX,
-            halfExtents=[0.08, 0.08, 0.04],
-            rgbaColor=[0.1, 0.1, 0.1, 1.0]
-        )
-        
-        sensor_collision = p.createCollisionShape(
-            p.GEOM_BOX,
-            halfExtents=[0.08, 0.08, 0.04]
-        )
+        sensor_visual, sensor_collision = self._get_box_shape((0.08, 0.08, 0.04), (0.1, 0.1, 0.1, 1.0))
         
         sensor_id = p.createMultiBody(
             baseMass=0.1,
@@ -391,152 +418,88 @@ class EnhancedSarusSimulation:
             'pause_sim': p.addUserDebugParameter("⏸️ Pause/Resume", 0, 1, 0),
             'step_sim': p.addUserDebugParameter("⏭️ Step Simulation", 0, 1, 0)
         }
+        self._index_controls()
         
-        # Add text info panel
-        self._add_info_panel()
-        
-    def _add_info_panel(self):
-        """Add information panel to the GUI"""
-        info_text = [
-            "🚀 SARUS ROBOT - ENHANCED SIMULATION",
-            "=" * 40,
-            "📋 CONTROL INSTRUCTIONS:",
-            "• Use sliders to control robot movement",
-            "• Camera Mode: 0=Follow, 1=Top, 2=Side, 3=Free",
-            "• Auto Demo: Automatic pathfinding navigation", 
-            "• Reset Position: Return robot to start",
-            "• Pause/Resume: Control simulation time",
-            "",
-            "🎮 KEYBOARD SHORTCUTS:",
-            "• WASD: Manual movement (if focus is on 3D view)",
-            "• C: Cycle camera modes",
-            "• R: Reset robot position",
-            "• SPACE: Pause/Resume simulation",
-            "",
-            "📊 FEATURES:",
-            "• Realistic physics simulation",
-            "• Multiple camera angles",
-            "• Interactive lab environment",
-            "• Real-time obstacle detection",
-            "• Enhanced visual effects"
-        ]
-        
-        # Add info as debug text (PyBullet limitation - text overlays are limited)
-        self.info_text_id = p.addUserDebugText(
-            "\n".join(info_text[:10]),  # First 10 lines
-            [0, 0, 2],
-            textColorRGB=[1, 1, 1],
-            textSize=1.2
-        )
+    def _index_controls(self):
+        """Rebuild the slider id tuple read by the interactive loop"""
+        self._control_ids = tuple(self.control_buttons.get(name, -1) for name in CONTROL_NAMES)
+    
+    def _get_robot_pose(self) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """Robot base position and orientation, cached until the next step"""
+        if self._robot_pose is None:
+            self._robot_pose = p.getBasePositionAndOrientation(self.robot_id)
+        return self._robot_pose
+    
+    def _step_simulation(self):
+        """Advance physics one step and drop the cached robot pose"""
+        p.stepSimulation()
+        self._robot_pose = None
+    
+    def _step_frame(self):
+        """Advance one frame of physics"""
+        for _ in range(self.PHYSICS_STEPS_PER_FRAME):
+            self._step_simulation()
     
     def update_camera(self):
         """Update camera position based on current mode"""
         if not self.gui_mode or self.robot_id is None:
             return
             
-        # Get robot position
-        robot_pos, robot_orn = p.getBasePositionAndOrientation(self.robot_id)
-        self.robot_position = robot_pos
-        
-        # Camera modes
-        if self.camera_mode == 0:  # Follow camera
-            camera_pos = [
-                robot_pos[0] - self.camera_distance * math.cos(0),
-                robot_pos[1] - self.camera_distance * math.sin(0),
-                robot_pos[2] + 2.0
-            ]
-            target_pos = robot_pos
-            
-        elif self.camera_mode == 1:  # Top-down camera
-            camera_pos = [robot_pos[0], robot_pos[1], robot_pos[2] + 5.0]
-            target_pos = robot_pos
-            
-        elif self.camera_mode == 2:  # Side camera
-            camera_pos = [robot_pos[0] + self.camera_distance, robot_pos[1], robot_pos[2] + 1.0]
-            target_pos = robot_pos
-            
-        else:  # Free camera (user controlled)
+        # Follow, top and side modes all track the robot
+        if self.camera_mode > 2:  # Free camera (user controlled)
             return  # Let user control camera
         
+        robot_pos, _ = self._get_robot_pose()
+        self.robot_position = robot_pos
+        
         # Set camera
         p.resetDebugVisualizerCamera(
             cameraDistance=self.camera_distance,
             cameraYaw=45,
             cameraPitch=-30,
-            cameraTargetPosition=target_pos
+            cameraTargetPosition=robot_pos
         )
     
     def move_robot(self, linear_velocity: float, angular_velocity: float):
         """Move the robot with given velocities"""
         if self.robot_id is None:
             return
-            
-        # Apply forces to move the robot
-        robot_pos, robot_orn = p.getBasePositionAndOrientation(self.robot_id)
-        
-        # Convert quaternion to euler for direction calculation
-        euler = p.getEulerFromQuaternion(robot_orn)
-        robot_yaw = euler[2]
         
-        # Calculate force direction
-        force_x = linear_velocity * math.cos(robot_yaw)
-        force_y = linear_velocity * math.sin(robot_yaw)
+        _, (qx, qy, qz, qw) = self._get_robot_pose()
         
-        # Apply linear force
-        p.applyExternalForce(
+        # Set base velocity directly: one call, and it persists across the frame's physics steps
+        p.resetBaseVelocity(
             self.robot_id,
-            -1,  # Base link
-            [force_x * 50, force_y * 50, 0],  # Force vector
-            robot_pos,  # Force position
-            p.WORLD_FRAME
-        )
-        
-        # Apply angular force
-        p.applyExternalTorque(
-            self.robot_id,
-            -1,  # Base link
-            [0, 0, angular_velocity * 10],  # Torque vector
-            p.WORLD_FRAME
+            linearVelocity=heading_vector(qx, qy, qz, qw, linear_velocity),
+            angularVelocity=(0.0, 0.0, angular_velocity)
         )
     
-    def check_obstacles(self) -> List[str]:
-        """Check for obstacles around the robot"""
+    def _sense_obstacles(self) -> List[bool]:
+        """Refresh and return the per-sensor hit flags, indexed like _sensor_names"""
+        flags = self._obstacle_flags
         if self.robot_id is None:
-            return []
+            flags[:] = [False] * len(flags)
+            return flags
             
-        obstacles = []
-        robot_pos, robot_orn = p.getBasePositionAndOrientation(self.robot_id)
-        
-        # Define sensor positions relative to robot
-        sensor_positions = {
-            'front_left': [0.3, 0.15, 0],
-            'front_center': [0.3, 0, 0],
-            'front_right': [0.3, -0.15, 0],
-            'left': [0, 0.2, 0],
-            'right': [0, -0.2, 0]
-        }
+        robot_pos, robot_orn = self._get_robot_pose()
         
-        # Check each sensor position
-        for sensor_name, relative_pos in sensor_positions.items():
-            # Transform relative position to world coordinates
-            world_pos = [
-                robot_pos[0] + relative_pos[0],
-                robot_pos[1] + relative_pos[1], 
-                robot_pos[2] + relative_pos[2] + 0.1
-            ]
-            
-            # Raycast to detect obstacles
-            ray_from = robot_pos
-            ray_to = world_pos
-            
-            ray_results = p.rayTest(ray_from, ray_to)
-            
-            if ray_results and ray_results[0][0] != -1:  # Hit something
-                hit_object = ray_results[0][0]
-                if hit_object != self.robot_id:  # Not hitting self
-                    obstacles.append(sensor_name)
+        # Rotate the sensor offsets into the world frame in one multiply
+        rotation = np.asarray(p.getMatrixFromQuaternion(robot_orn)).reshape(3, 3)
+        ray_from = np.broadcast_to(robot_pos, self._sensor_offsets.shape)
+        ray_to = self._sensor_offsets @ rotation.T + ray_from
         
-        return obstacles
+        # Raycast every sensor in one batched query, ignoring the robot's own parts
+        ray_results = p.rayTestBatch(ray_from.tolist(), ray_to.tolist(), numThreads=0,
+                                     collisionFilterMask=~self.ROBOT_COLLISION_GROUP)
+        
+        for i, hit in enumerate(ray_results):
+            flags[i] = hit[0] != -1
+        return flags
+    
+    def check_obstacles(self) -> List[str]:
+        """Check for obstacles around the robot"""
+        return [sensor_name for sensor_name, hit in zip(self._sensor_names, self._sense_obstacles())
+                if hit]
     
     def run_auto_demo(self):
         """Run automatic demonstration with pathfinding"""
@@ -551,23 +514,25 @@ class EnhancedSarusSimulation:
             ("🛑 Mission complete - stopping", lambda: self.move_robot(0, 0), 1.0)
         ]
         
+        frame = FixedRateTimer(self.FRAME_PERIOD)
         for description, action, duration in demo_sequence:
             if not self.simulation_running:
                 break
                 
             print(f"   {description}")
             
-            start_time = time.time()
-            while time.time() - start_time < duration and self.simulation_running:
+            start_time = time.perf_counter()
+            while time.perf_counter() - start_time < duration and self.simulation_running:
                 # Check for obstacles and adjust
-                obstacles = self.check_obstacles()
-                if obstacles:
-                    print(f"   ⚠️ Obstacles detected: {obstacles}")
+                obstacles = self._sense_obstacles()
+                if any(obstacles):
+                    detected = [name for name, hit in zip(self._sensor_names, obstacles) if hit]
+                    print(f"   ⚠️ Obstacles detected: {detected}")
                     # Smart obstacle avoidance
-                    if 'front_center' in obstacles:
-                        if 'front_left' not in obstacles:
+                    if obstacles[FRONT_CENTER]:
+                        if not obstacles[FRONT_LEFT]:
                             self.move_robot(0, -0.4)  # Turn right
-                        elif 'front_right' not in obstacles:
+                        elif not obstacles[FRONT_RIGHT]:
                             self.move_robot(0, 0.4)   # Turn left
                         else:
                             self.move_robot(-0.2, 0.5)  # Back up and turn
@@ -578,8 +543,8 @@ class EnhancedSarusSimulation:
                 
                 # Update camera and simulation
                 self.update_camera()
-                p.stepSimulation()
-                time.sleep(1./60.)  # 60 FPS
+                self._step_frame()
+                frame.wait()  # 60 FPS
         
         print("🎉 Enhanced Auto Demo Complete!")
         print("   🚀 Robot navigation successful!")
@@ -591,23 +556,13 @@ class EnhancedSarusSimulation:
     def _show_run_again_option(self):
         """Show run again option in GUI"""
         if self.gui_mode:
-            # Add run again button
-            run_again_id = p.addUserDebugParameter("🔄 Run Demo Again", 0, 1, 0)
+            # Add run again button, read by the interactive loop with the other controls
+            if 'run_again' not in self.control_buttons:
+                self.control_buttons['run_again'] = p.addUserDebugParameter("🔄 Run Demo Again", 0, 1, 0)
+                self._index_controls()
             
             print("🔄 Demo completed! Use the 'Run Demo Again' button to repeat")
             print("   or close the simulation window to exit")
-            
-            # Monitor for run again button
-            def check_run_again():
-                while self.simulation_running:
-                    if p.readUserDebugParameter(run_again_id) > 0.5:
-                        p.removeUserDebugItem(run_again_id)
-                        self.run_auto_demo()
-                        break
-                    time.sleep(0.1)
-            
-            import threading
-            threading.Thread(target=check_run_again, daemon=True).start()
     
     def run_interactive_mode(self):
         """Run interactive mode with full control"""
@@ -622,67 +577,79 @@ class EnhancedSarusSimulation:
         print("🎮 Keep the 3D window focused for best experience!")
         
         self.simulation_running = True
-        last_controls = {}
+        # Current and previous slider values, indexed by the CONTROL_NAMES constants
+        controls = list(CONTROL_DEFAULTS)
+        last_controls = list(CONTROL_DEFAULTS)
+        all_controls = range(len(CONTROL_NAMES))
+        frame = FixedRateTimer(self.FRAME_PERIOD)
+        frame_index = 0
         
         try:
             while self.simulation_running:
-                # Read control inputs
-                current_controls = {}
-                for name, param_id in self.control_buttons.items():
-                    current_controls[name] = p.readUserDebugParameter(param_id)
+                # Read control inputs: drive sliders every frame, the rest keep their last value between polls
+                indices = all_controls if frame_index % self.CONTROL_POLL_FRAMES == 0 else self.DRIVE_CONTROLS
+                frame_index += 1
+                controls[:] = last_controls
+                control_ids = self._control_ids
+                for i in indices:
+                    if control_ids[i] >= 0:
+                        controls[i] = p.readUserDebugParameter(control_ids[i])
                 
                 # Process movement controls
                 linear_vel = 0
                 angular_vel = 0
-                speed_multiplier = current_controls.get('speed', 0.5)
+                speed_multiplier = controls[SPEED]
                 
-                if current_controls.get('forward', 0) > 0.5:
+                if controls[FORWARD] > 0.5:
                     linear_vel = speed_multiplier
-                elif current_controls.get('backward', 0) > 0.5:
+                elif controls[BACKWARD] > 0.5:
                     linear_vel = -speed_multiplier
                 
-                if current_controls.get('left', 0) > 0.5:
+                if controls[LEFT] > 0.5:
                     angular_vel = speed_multiplier * 0.8
-                elif current_controls.get('right', 0) > 0.5:
+                elif controls[RIGHT] > 0.5:
                     angular_vel = -speed_multiplier * 0.8
                 
-                if current_controls.get('stop', 0) > 0.5:
+                if controls[STOP] > 0.5:
                     linear_vel = angular_vel = 0
                 
                 # Apply movement
                 self.move_robot(linear_vel, angular_vel)
                 
                 # Handle camera controls
-                new_camera_mode = int(current_controls.get('camera_mode', 0))
+                new_camera_mode = int(controls[CAMERA_MODE])
                 if new_camera_mode != self.camera_mode:
                     self.camera_mode = new_camera_mode
                     print(f"📷 Camera mode changed to: {['Follow', 'Top', 'Side', 'Free'][self.camera_mode]}")
                 
-                self.camera_distance = current_controls.get('camera_distance', 3.0)
+                self.camera_distance = controls[CAMERA_DISTANCE]
                 self.update_camera()
                 
                 # Handle special controls
-                if current_controls.get('auto_demo', 0) > 0.5 and last_controls.get('auto_demo', 0) <= 0.5:
+                if controls[AUTO_DEMO] > 0.5 and last_controls[AUTO_DEMO] <= 0.5:
                     print("🎭 Starting Auto Demo from Interactive Mode...")
                     self.run_auto_demo()
                 
-                if current_controls.get('reset_position', 0) > 0.5 and last_controls.get('reset_position', 0) <= 0.5:
+                if controls[RUN_AGAIN] > 0.5 and last_controls[RUN_AGAIN] <= 0.5:
+                    self.run_auto_demo()
+                
+                if controls[RESET_POSITION] > 0.5 and last_controls[RESET_POSITION] <= 0.5:
                     self._reset_robot_position()
                 
                 # Simulation controls
-                if current_controls.get('pause_sim', 0) > 0.5:
+                if controls[PAUSE_SIM] > 0.5:
                     print("⏸️ Simulation paused - adjust controls and unpause to continue")
-                    while current_controls.get('pause_sim', 0) > 0.5:
-                        current_controls['pause_sim'] = p.readUserDebugParameter(self.control_buttons['pause_sim'])
+                    while controls[PAUSE_SIM] > 0.5:
+                        controls[PAUSE_SIM] = p.readUserDebugParameter(self._control_ids[PAUSE_SIM])
                         time.sleep(0.1)
                     print("▶️ Simulation resumed")
                 
                 # Store last controls
-                last_controls = current_controls.copy()
+                controls, last_controls = last_controls, controls
                 
                 # Step simulation
-                p.stepSimulation()
-                time.sleep(1./60.)  # 60 FPS
+                self._step_frame()
+                frame.wait()  # 60 FPS
                 
         except KeyboardInterrupt:
             print("\n⏹️ Interactive mode stopped by user")
@@ -697,6 +664,7 @@ class EnhancedSarusSimulation:
                 [0, 0, 0.1],
                 [0, 0, 0, 1]
             )
+            self._robot_pose = None
             print("🔄 Robot position reset to center")
     
     def run_component_test(self):
@@ -707,6 +675,9 @@ class EnhancedSarusSimulation:
         
         self.simulation_running = True
         
+        # Tests are pure physics; redraw only for the observation loop below
+        p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 0)
+        
         test_sequence = [
             ("🚗 Motor Systems", self._test_motors),
             ("📡 Sensor Systems", self._test_sensors),
@@ -729,15 +700,17 @@ class EnhancedSarusSimulation:
         print("🎉 Robot systems are functioning optimally!")
         
         # Keep simulation running for observation
+        p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 1)
         print("\n📊 Simulation will continue running for observation...")
         print("   Use control sliders to interact with the robot")
         print("   Close window or press Ctrl+C to exit")
         
+        frame = FixedRateTimer(self.FRAME_PERIOD)
         try:
             while self.simulation_running:
                 self.update_camera()
-                p.stepSimulation()
-                time.sleep(1./60.)
+                self._step_frame()
+                frame.wait()
         except KeyboardInterrupt:
             print("\n⏹️ Component test stopped by user")
     
@@ -751,13 +724,14 @@ class EnhancedSarusSimulation:
             ("Stop", lambda: self.move_robot(0, 0))
         ]
         
+        frame = FixedRateTimer(self.FRAME_PERIOD)
         for name, action in movements:
             print(f"   ✓ {name}")
             action()
             for _ in range(30):  # Run for 0.5 seconds
-                p.stepSimulation()
+                self._step_frame()
                 self.update_camera()
-                time.sleep(1./60.)
+                frame.wait()
     
     def _test_sensors(self):
         """Test sensor functionality"""
@@ -788,13 +762,13 @@ class EnhancedSarusSimulation:
         # Demo a small navigation sequence
         print("   → Running mini navigation test...")
         self.move_robot(0.3, 0)
+        frame = FixedRateTimer(self.FRAME_PERIOD)
         for _ in range(60):
-            obstacles = self.check_obstacles()
-            if obstacles:
+            if any(self._sense_obstacles()):
                 self.move_robot(0, 0.3)  # Turn if obstacle detected
-            p.stepSimulation()
+            self._step_frame()
             self.update_camera()
-            time.sleep(1./60.)
+            frame.wait()
     
     def _test_power(self):
         """Test power management"""
@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers
+"""
+
+import sys
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -12,6 +12,7 @@ from pathlib import Path
 from datetime import datetime
 
 from ..config.settings import SYSTEM_CONFIG, LOGS_DIR
+from .logging import use_queue_handler
 
 def setup_logging():
     """Configure logging for the entire Sarus system"""
@@ -63,6 +64,9 @@ def setup_logging():
     error_handler.setFormatter(detailed_formatter)
     root_logger.addHandler(error_handler)
     
+    # Hand all sinks to a background writer thread
+    use_queue_handler(root_logger)
+    
     # Component-specific loggers
     setup_component_loggers()
     
@@ -97,6 +101,7 @@ def setup_component_loggers():
     mission_handler.setFormatter(mission_formatter)
     mission_logger.addHandler(mission_handler)
     mission_logger.setLevel(logging.INFO)
+    use_queue_handler(mission_logger)
 
 def get_logger(name: str) -> logging.Logger:
     """
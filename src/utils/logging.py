@@ -4,12 +4,20 @@
 Enhanced logging system for Sarus AI Lab Assistant Robot
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# Environmental readings buffered before each write to the log file
+ENV_LOG_BATCH_SIZE = 60
+
+# Running queue listeners, keyed by the name of the logger they serve
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
 
 def setup_logging(
     log_level: str = "INFO",
@@ -84,6 +92,9 @@ def setup_logging(
     error_handler.setFormatter(detailed_formatter)
     root_logger.addHandler(error_handler)
     
+    # Hand all sinks to a background writer thread
+    use_queue_handler(root_logger)
+    
     # System log for startup/shutdown
     startup_logger = logging.getLogger("sarus.startup")
     # Avoid non-ASCII characters to prevent console encoding issues on Windows
@@ -93,6 +104,55 @@ def setup_logging(
     
     return root_logger
 
+def use_queue_handler(logger: logging.Logger) -> bool:
+    """
+    Move a logger's handlers behind a QueueHandler/QueueListener pair
+    
+    Logging calls then only enqueue the record; formatting and file/console
+    I/O happen on the listener's background thread, so async code is not
+    blocked on disk writes. The listener is flushed and stopped at interpreter
+    exit. Calling this again on the same logger is a no-op while its queue
+    handler is installed; once the handlers have been replaced, the previous
+    listener is stopped and its handlers closed before a new one starts.
+    
+    Args:
+        logger: Logger whose current handlers should be served by the listener
+    
+    Returns:
+        True if a listener was started, False if there was nothing to queue
+    """
+    if not logger.handlers or any(
+        isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers
+    ):
+        return False
+    
+    _stop_listener(logger.name)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logger.handlers, respect_handler_level=True
+    )
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    _listeners[logger.name] = listener
+    
+    return True
+
+def _stop_listener(name: str):
+    """Drain and stop the listener serving a logger, closing its handlers"""
+    listener = _listeners.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+@atexit.register
+def _stop_all_listeners():
+    """Flush every queued logger at interpreter exit"""
+    for name in list(_listeners):
+        _stop_listener(name)
+
 def get_mission_logger(mission_id: str) -> logging.Logger:
     """
     Create a dedicated logger for mission reporting
@@ -141,10 +201,12 @@ def get_security_logger() -> logging.Logger:
     """
     
     logger = logging.getLogger("sarus.security")
+    if logger.handlers:
+        return logger
     
     # Security log directory
     log_dir = Path(__file__).parent.parent.parent / "logs" / "security"
-    log_dir.mkdir(exist_ok=True)
+    log_dir.mkdir(parents=True, exist_ok=True)
     
     # Daily security log file
     date_str = datetime.now().strftime("%Y%m%d")
@@ -162,6 +224,7 @@ def get_security_logger() -> logging.Logger:
     
     logger.addHandler(handler)
     logger.setLevel(logging.WARNING)
+    use_queue_handler(logger)
     
     return logger
 
@@ -174,10 +237,12 @@ def get_environmental_logger() -> logging.Logger:
     """
     
     logger = logging.getLogger("sarus.environmental")
+    if logger.handlers:
+        return logger
     
     # Environmental log directory
     log_dir = Path(__file__).parent.parent.parent / "logs" / "environmental"
-    log_dir.mkdir(exist_ok=True)
+    log_dir.mkdir(parents=True, exist_ok=True)
     
     # Daily environmental log file
     date_str = datetime.now().strftime("%Y%m%d")
@@ -193,8 +258,12 @@ def get_environmental_logger() -> logging.Logger:
     )
     handler.setFormatter(formatter)
     
-    logger.addHandler(handler)
+    # Write readings to disk in batches; each row keeps its own timestamp
+    logger.addHandler(logging.handlers.MemoryHandler(
+        capacity=ENV_LOG_BATCH_SIZE, flushLevel=logging.ERROR, target=handler
+    ))
     logger.setLevel(logging.INFO)
+    use_queue_handler(logger)
     
     return logger
 
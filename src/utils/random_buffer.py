@@ -0,0 +1,38 @@
+"""
+Buffered random numbers for simulation loops
+
+Draws uniform samples from a NumPy Generator in blocks, so each call
+in a per-tick simulation path is a list index rather than an RNG call.
+"""
+
+from typing import Optional, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar('T')
+
+class UniformBuffer:
+    """Uniform [0, 1) samples drawn from a NumPy Generator in blocks"""
+
+    def __init__(self, size: int = 1024, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)
+        self._size = size
+        self._buf = self._rng.random(size).tolist()  # Python floats, no per-draw boxing
+        self._i = 0
+
+    def random(self) -> float:
+        """Next sample in [0, 1)"""
+        if self._i >= self._size:
+            self._buf = self._rng.random(self._size).tolist()
+            self._i = 0
+        value = self._buf[self._i]
+        self._i += 1
+        return value
+
+    def uniform(self, low: float, high: float) -> float:
+        """Next sample in [low, high)"""
+        return low + (high - low) * self.random()
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Random element of a non-empty sequence"""
+        return seq[int(self.random() * len(seq))]
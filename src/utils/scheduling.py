@@ -0,0 +1,53 @@
+"""
+Fixed-rate scheduling for monitoring loops
+
+Sleeping a fixed amount after each iteration makes the period
+work + sleep, so loops drift under load. FixedRateTicker sleeps
+until the next deadline instead, and skips ticks it has overrun
+rather than bursting to catch up. FixedRateTimer does the same for
+blocking loops.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+class FixedRateTicker:
+    """Deadline-based sleeper for a loop running every `period` seconds"""
+
+    def __init__(self, period: float):
+        self.period = period
+        self._next: Optional[float] = None
+
+    async def wait(self):
+        """Sleep until the next tick"""
+        now = asyncio.get_running_loop().time()
+        if self._next is None:
+            self._next = now
+        self._next += self.period
+
+        if self._next < now:
+            # Overran one or more ticks: realign to the next future deadline
+            self._next += ((now - self._next) // self.period + 1) * self.period
+
+        await asyncio.sleep(self._next - now)
+
+class FixedRateTimer:
+    """Blocking counterpart of FixedRateTicker for synchronous loops"""
+
+    def __init__(self, period: float):
+        self.period = period
+        self._next: Optional[float] = None
+
+    def wait(self):
+        """Sleep until the next tick"""
+        now = time.perf_counter()
+        if self._next is None:
+            self._next = now
+        self._next += self.period
+
+        if self._next < now:
+            # Overran one or more ticks: realign to the next future deadline
+            self._next += ((now - self._next) // self.period + 1) * self.period
+
+        time.sleep(self._next - now)
@@ -79,7 +79,7 @@ Debug: {'On' if args.debug else 'Off'}
         sys.exit(1)
     finally:
         if 'robot' in locals():
-            robot.shutdown()
+            await robot.shutdown()
 
 async def run_test_sequence(robot):
     """Run a test sequence for validation"""
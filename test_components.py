@@ -223,7 +223,7 @@ class ComponentTester:
             print("✅ Sarus robot initialized successfully")
             print(f"✅ Robot state: {robot.state}")
             
-            robot.shutdown()
+            await robot.shutdown()
             print("✅ Robot Integration test completed")
             
         except Exception as e: